@@ -3,32 +3,77 @@
 # Version
 __version__ = "3.1.1"
 
-# Core modules
-from .core import (
-    BrowserManager,
-    login_with_credentials,
-    login_with_cookie,
-    is_logged_in,
-    wait_for_manual_login,
-    load_credentials_from_env,
+import importlib
+from typing import TYPE_CHECKING
+
+# Core and scraper modules pull in Playwright, so they are imported on first
+# attribute access (PEP 562). Loading models, callbacks or exceptions alone
+# stays cheap.
+_LAZY_IMPORTS = {
+    # Core
+    "BrowserManager": ".core",
+    "BrowserPool": ".core",
+    "BrowserContextPool": ".core",
+    "login_with_credentials": ".core",
+    "login_with_cookie": ".core",
+    "is_logged_in": ".core",
+    "wait_for_manual_login": ".core",
+    "load_credentials_from_env": ".core",
     # Exceptions
-    LinkedInScraperException,
-    AuthenticationError,
-    RateLimitError,
-    ElementNotFoundError,
-    ProfileNotFoundError,
-    NetworkError,
-    ScrapingError,
-)
+    "LinkedInScraperException": ".core.exceptions",
+    "AuthenticationError": ".core.exceptions",
+    "RateLimitError": ".core.exceptions",
+    "ElementNotFoundError": ".core.exceptions",
+    "ProfileNotFoundError": ".core.exceptions",
+    "NetworkError": ".core.exceptions",
+    "ScrapingError": ".core.exceptions",
+    # Scrapers
+    "PersonScraper": ".scrapers",
+    "CompanyScraper": ".scrapers",
+    "JobScraper": ".scrapers",
+    "JobSearchScraper": ".scrapers",
+    "CompanyPostsScraper": ".scrapers",
+}
+
+if TYPE_CHECKING:
+    from .core import (
+        BrowserManager,
+        BrowserPool,
+        BrowserContextPool,
+        login_with_credentials,
+        login_with_cookie,
+        is_logged_in,
+        wait_for_manual_login,
+        load_credentials_from_env,
+        LinkedInScraperException,
+        AuthenticationError,
+        RateLimitError,
+        ElementNotFoundError,
+        ProfileNotFoundError,
+        NetworkError,
+        ScrapingError,
+    )
+    from .scrapers import (
+        PersonScraper,
+        CompanyScraper,
+        JobScraper,
+        JobSearchScraper,
+        CompanyPostsScraper,
+    )
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Scrapers
-from .scrapers import (
-    PersonScraper,
-    CompanyScraper,
-    JobScraper,
-    JobSearchScraper,
-    CompanyPostsScraper,
-)
 
 # Callbacks
 from .callbacks import (
@@ -59,6 +104,8 @@ __all__ = [
     "__version__",
     # Core
     "BrowserManager",
+    "BrowserPool",
+    "BrowserContextPool",
     "login_with_credentials",
     "login_with_cookie",
     "is_logged_in",
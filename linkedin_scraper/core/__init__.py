@@ -1,14 +1,8 @@
 """Core modules for LinkedIn scraper."""
 
-from .browser import BrowserManager
-from .auth import (
-    login_with_credentials,
-    login_with_cookie,
-    is_logged_in,
-    wait_for_manual_login,
-    load_credentials_from_env,
-    warm_up_browser
-)
+import importlib
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     LinkedInScraperException,
     AuthenticationError,
@@ -18,25 +12,86 @@ from .exceptions import (
     NetworkError,
     ScrapingError
 )
-from .utils import (
-    retry_async,
-    detect_rate_limit,
-    wait_for_element_smart,
-    extract_text_safe,
-    scroll_to_bottom,
-    scroll_to_half,
-    click_see_more_buttons,
-    handle_modal_close,
-    is_page_loaded
-)
+
+# auth and utils import Playwright at module level, so they (and browser, for
+# symmetry) load on first attribute access (PEP 562). Importing the
+# exceptions, e.g. via the package root, stays cheap.
+_LAZY_IMPORTS = {
+    # Browser
+    'BrowserManager': '.browser',
+    'BrowserPool': '.browser',
+    'BrowserContextPool': '.browser',
+    # Auth
+    'login_with_credentials': '.auth',
+    'login_with_cookie': '.auth',
+    'is_logged_in': '.auth',
+    'is_auth_blocked': '.auth',
+    'wait_for_manual_login': '.auth',
+    'load_credentials_from_env': '.auth',
+    'warm_up_browser': '.auth',
+    # Utils
+    'retry_async': '.utils',
+    'detect_rate_limit': '.utils',
+    'wait_for_element_smart': '.utils',
+    'wait_for_all': '.utils',
+    'extract_text_safe': '.utils',
+    'scroll_to_bottom': '.utils',
+    'scroll_to_half': '.utils',
+    'click_see_more_buttons': '.utils',
+    'handle_modal_close': '.utils',
+    'is_page_loaded': '.utils',
+    'block_resources': '.utils',
+}
+
+if TYPE_CHECKING:
+    from .browser import BrowserManager, BrowserPool, BrowserContextPool
+    from .auth import (
+        login_with_credentials,
+        login_with_cookie,
+        is_logged_in,
+        is_auth_blocked,
+        wait_for_manual_login,
+        load_credentials_from_env,
+        warm_up_browser
+    )
+    from .utils import (
+        retry_async,
+        detect_rate_limit,
+        wait_for_element_smart,
+        wait_for_all,
+        extract_text_safe,
+        scroll_to_bottom,
+        scroll_to_half,
+        click_see_more_buttons,
+        handle_modal_close,
+        is_page_loaded,
+        block_resources
+    )
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Browser
     'BrowserManager',
+    'BrowserPool',
+    'BrowserContextPool',
     # Auth
     'login_with_credentials',
     'login_with_cookie',
     'is_logged_in',
+    'is_auth_blocked',
     'wait_for_manual_login',
     'load_credentials_from_env',
     'warm_up_browser',
@@ -52,10 +107,12 @@ __all__ = [
     'retry_async',
     'detect_rate_limit',
     'wait_for_element_smart',
+    'wait_for_all',
     'extract_text_safe',
     'scroll_to_bottom',
     'scroll_to_half',
     'click_see_more_buttons',
     'handle_modal_close',
     'is_page_loaded',
+    'block_resources',
 ]
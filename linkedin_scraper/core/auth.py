@@ -13,6 +13,12 @@ from .utils import detect_rate_limit
 
 logger = logging.getLogger(__name__)
 
+# URL paths only reachable with a logged-in session
+_AUTHENTICATED_ONLY_PATHS = ('/feed', '/mynetwork', '/messaging', '/notifications')
+
+# URL paths LinkedIn redirects to when the session is missing or challenged
+_AUTH_BLOCKERS = ('/login', '/authwall', '/checkpoint', '/challenge', '/uas/login', '/uas/consumer-email-challenge')
+
 
 async def warm_up_browser(page: Page) -> None:
     """
@@ -242,6 +248,19 @@ async def login_with_cookie(page: Page, cookie_value: str) -> None:
          raise AuthenticationError(f"Cookie authentication error: {e}")
 
 
+def is_auth_blocked(url: str) -> bool:
+    """
+    Check if a URL is a login, authwall or challenge page.
+    
+    Args:
+        url: Page URL
+        
+    Returns:
+        True if the URL means the session is not authenticated
+    """
+    return any(pattern in url for pattern in _AUTH_BLOCKERS)
+
+
 async def is_logged_in(page: Page) -> bool:
     """
     Check if currently logged in to LinkedIn.
@@ -256,8 +275,7 @@ async def is_logged_in(page: Page) -> bool:
         current_url = page.url
         
         # Step 1: Fail-fast on auth blockers
-        auth_blockers = ['/login', '/authwall', '/checkpoint', '/challenge', '/uas/login', '/uas/consumer-email-challenge']
-        if any(pattern in current_url for pattern in auth_blockers):
+        if is_auth_blocked(current_url):
             return False
         
         # Step 2: Selector check (PRIMARY) - check for nav elements
@@ -270,8 +288,7 @@ async def is_logged_in(page: Page) -> bool:
         has_nav_elements = old_count > 0 or new_count > 0
         
         # Step 3: URL fallback - check for authenticated-only pages
-        authenticated_only_pages = ['/feed', '/mynetwork', '/messaging', '/notifications']
-        is_authenticated_page = any(pattern in current_url for pattern in authenticated_only_pages)
+        is_authenticated_page = any(pattern in current_url for pattern in _AUTHENTICATED_ONLY_PATHS)
         
         # Return True if either nav elements found or on authenticated page
         return has_nav_elements or is_authenticated_page
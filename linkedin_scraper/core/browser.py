@@ -1,17 +1,262 @@
 """Browser lifecycle management for Playwright."""
 
 import asyncio
-import json
 import logging
+import os
+from collections import deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from typing import TYPE_CHECKING, Optional, AsyncIterator, Deque, Dict, Any, Iterable, List, Tuple
 
 from .exceptions import NetworkError
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
+
 logger = logging.getLogger(__name__)
 
 
+def _write_private_file(path: Path, data: bytes) -> None:
+    """Write bytes to a file that only the current user can read."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Maximum number of cookies sent to the driver in one add_cookies() call
+_COOKIE_BATCH_SIZE = 500
+
+# Fields shared by every cookie set through BrowserManager
+_COOKIE_TEMPLATE: Dict[str, Any] = {"domain": ".linkedin.com", "path": "/"}
+
+
+def _make_cookie(name: str, value: str, domain: str) -> Dict[str, Any]:
+    """Build an add_cookies() entry from the shared template."""
+    cookie = _COOKIE_TEMPLATE.copy()
+    cookie["name"] = name
+    cookie["value"] = value
+    if domain != ".linkedin.com":
+        cookie["domain"] = domain
+    return cookie
+
+
+def _dedupe_cookies(cookies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop malformed cookies and keep the last entry per (name, domain, path).
+    
+    add_cookies() rejects the whole batch if a single entry is invalid, and
+    duplicates are serialized to the driver only to be overwritten.
+    """
+    unique: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for cookie in cookies:
+        scope = cookie.get("domain") or cookie.get("url")
+        if not cookie.get("name") or "value" not in cookie or not scope:
+            continue
+        unique[(cookie["name"], scope, cookie.get("path", "/"))] = cookie
+    return list(unique.values())
+
+
+class BrowserPool:
+    """
+    Pool of launched browsers shared between BrowserManager instances.
+    
+    Browsers are keyed by their launch configuration. A manager created with
+    a pool takes a warm browser from it on start() and hands it back on
+    close() instead of shutting Chromium down, so repeated scrapes only pay
+    for a new context rather than a full browser launch.
+    
+    Example:
+        pool = BrowserPool()
+        for url in urls:
+            async with BrowserManager(pool=pool) as browser:
+                ...
+        await pool.close()
+    """
+    
+    def __init__(self):
+        """Initialize an empty browser pool."""
+        self._idle: Dict[Tuple[Any, ...], List[Tuple["Playwright", "Browser"]]] = {}
+    
+    async def acquire(self, key: Tuple[Any, ...]) -> Optional[Tuple["Playwright", "Browser"]]:
+        """
+        Take an idle browser launched with the given configuration.
+        
+        Args:
+            key: Launch configuration key
+            
+        Returns:
+            Tuple of (playwright, browser), or None if no browser is idle
+        """
+        idle = self._idle.get(key)
+        while idle:
+            playwright, browser = idle.pop()
+            if browser.is_connected():
+                return playwright, browser
+            await playwright.stop()
+        return None
+    
+    def release(self, key: Tuple[Any, ...], playwright: "Playwright", browser: "Browser") -> None:
+        """
+        Return a browser to the pool for reuse.
+        
+        Args:
+            key: Launch configuration key
+            playwright: Playwright instance that owns the browser
+            browser: Browser to keep alive
+        """
+        self._idle.setdefault(key, []).append((playwright, browser))
+    
+    async def close(self) -> None:
+        """Close all idle browsers in the pool."""
+        idle, self._idle = self._idle, {}
+        for entries in idle.values():
+            for playwright, browser in entries:
+                try:
+                    await browser.close()
+                    await playwright.stop()
+                except Exception as e:
+                    logger.error("Error closing pooled browser: %s", e)
+
+
+class BrowserContextPool:
+    """
+    Fixed set of browser contexts that scrapes check out one at a time.
+    
+    Contexts are created once on start() and handed back after each scrape,
+    so many profiles share a handful of warm contexts (cookies, HTTP cache,
+    open connections) instead of paying for a new one each, and memory stays
+    bounded by the pool size. The HTTP cache only helps contexts that are not
+    routed: Playwright disables it once block_resources() routes a context.
+    
+    Example:
+        async with BrowserManager() as browser:
+            async with BrowserContextPool(
+                browser.browser, size=4, storage_state="session.json"
+            ) as contexts:
+                results = await PersonScraper.scrape_many(contexts, urls)
+    """
+    
+    def __init__(
+        self,
+        browser: "Browser",
+        size: int = 2,
+        storage_state: Optional[Any] = None,
+        **context_options: Any
+    ):
+        """
+        Initialize the context pool.
+        
+        Args:
+            browser: Launched browser to create the contexts in
+            size: Number of contexts in the pool
+            storage_state: Session file path or storage state dict loaded into
+                every context
+            **context_options: Additional new_context() options
+        """
+        self.browser = browser
+        self.size = size
+        self._context_options: Dict[str, Any] = dict(context_options)
+        if storage_state is not None:
+            self._context_options["storage_state"] = storage_state
+        
+        self._contexts: List["BrowserContext"] = []
+        self._idle: Optional["asyncio.Queue[BrowserContext]"] = None
+        # Contexts currently handed out by acquire()
+        self._checked_out: List["BrowserContext"] = []
+    
+    async def __aenter__(self) -> "BrowserContextPool":
+        """Create the pooled contexts."""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the pooled contexts."""
+        await self.close()
+    
+    async def start(self) -> None:
+        """Create the pooled contexts unless they already exist."""
+        if self._idle is not None:
+            return
+        
+        results = await asyncio.gather(
+            *(self.browser.new_context(**self._context_options) for _ in range(self.size)),
+            return_exceptions=True,
+        )
+        self._contexts = [r for r in results if not isinstance(r, BaseException)]
+        
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await self.close()
+            raise NetworkError(f"Failed to create browser context: {errors[0]}")
+        
+        self._idle = asyncio.Queue()
+        for context in self._contexts:
+            self._idle.put_nowait(context)
+        
+        logger.info("Created %s pooled browser contexts", self.size)
+    
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator["BrowserContext"]:
+        """
+        Check out an idle context, waiting for one if all are in use.
+        
+        The context goes back to the pool when the block exits.
+        
+        Example:
+            async with pool.acquire() as context:
+                page = await context.new_page()
+        """
+        if self._idle is None:
+            raise RuntimeError("Context pool not started. Use async context manager or call start().")
+        
+        context = await self._idle.get()
+        self._checked_out.append(context)
+        try:
+            yield context
+        finally:
+            self._release(context)
+    
+    def _release(self, context: "BrowserContext") -> None:
+        """Return a checked out context to the pool; later calls are ignored."""
+        if context not in self._checked_out:
+            return
+        self._checked_out.remove(context)
+        if self._idle is not None and context in self._contexts:
+            self._idle.put_nowait(context)
+    
+    async def close(self) -> None:
+        """Close every context in the pool."""
+        contexts, self._contexts = self._contexts, []
+        self._idle = None
+        self._checked_out = []
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.error("Error closing pooled context: %s", e)
+
+
 class BrowserManager:
     """Async context manager for Playwright browser lifecycle."""
     
@@ -21,6 +266,11 @@ class BrowserManager:
         slow_mo: int = 0,
         viewport: Optional[Dict[str, int]] = None,
         user_agent: Optional[str] = None,
+        pool: Optional[BrowserPool] = None,
+        page_pool_size: int = 0,
+        reuse: bool = False,
+        block_assets: bool = False,
+        storage_state: Optional[Any] = None,
         **launch_options: Any
     ):
         """
@@ -31,6 +281,14 @@ class BrowserManager:
             slow_mo: Slow down operations by specified milliseconds
             viewport: Browser viewport size (default: 1280x720)
             user_agent: Custom user agent string
+            pool: Optional BrowserPool to take the browser from and return it to
+            page_pool_size: Number of blank pages to keep ready for new_page()
+            reuse: Pause instead of closing when leaving ``async with``, so the
+                same manager can be entered again without relaunching
+            block_assets: Abort image, font, media and tracker requests on
+                every page of the context. Leave off for interactive logins
+            storage_state: Session file path or storage state dict to create
+                the context with, instead of calling load_session() after start
             **launch_options: Additional Playwright launch options
         """
         self.headless = headless
@@ -38,11 +296,31 @@ class BrowserManager:
         self.viewport = viewport or {"width": 1280, "height": 720}
         self.user_agent = user_agent
         self.launch_options = launch_options
+        self.pool = pool
+        self.page_pool_size = page_pool_size
+        self.reuse = reuse
+        self.block_assets = block_assets
+        self.storage_state = storage_state
+        # Options passed to chromium.launch() and new_context(), built once
+        self._launch_options: Dict[str, Any] = {
+            "headless": headless,
+            "slow_mo": slow_mo,
+            **launch_options,
+        }
+        self._context_options: Dict[str, Any] = {"viewport": self.viewport}
+        if user_agent:
+            self._context_options["user_agent"] = user_agent
+        # Key identifying browsers launched with these options in a BrowserPool
+        self._pool_key = (headless, slow_mo, repr(sorted(launch_options.items())))
         
-        self._playwright: Optional[Playwright] = None
-        self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
-        self._page: Optional[Page] = None
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
+        self._page: Optional["Page"] = None
+        self._page_pool: Deque["Page"] = deque()
+        self._page_pool_task: Optional[asyncio.Task] = None
+        self._pending_cookies: Optional[List[Dict[str, Any]]] = None
+        self._start_count = 0
         self._is_authenticated = False
     
     async def __aenter__(self) -> "BrowserManager":
@@ -51,45 +329,83 @@ class BrowserManager:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Close browser and cleanup."""
-        await self.close()
+        """Close browser and cleanup (or pause it when reuse is enabled)."""
+        if self.reuse and self._start_count <= 1:
+            self._start_count = 0
+            await self.pause()
+        else:
+            await self.close()
     
     async def start(self) -> None:
-        """Start Playwright and launch browser."""
+        """
+        Start Playwright and launch browser.
+        
+        Calls are reference counted: starting an already running manager only
+        increments the count, and the browser is closed once close() has been
+        called as many times as start(). A manager whose browser has crashed
+        or disconnected launches a new one.
+        """
+        self._start_count += 1
+        if self._context is not None:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            logger.warning("Browser disconnected, launching a new one")
+            await self._discard_browser()
+        
+        from playwright.async_api import async_playwright
+        
         try:
-            self._playwright = await async_playwright().start()
-            
-            # Launch browser
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo,
-                **self.launch_options
-            )
+            pooled = await self.pool.acquire(self._pool_key) if self.pool else None
             
-            logger.info(f"Browser launched (headless={self.headless})")
+            if pooled:
+                self._playwright, self._browser = pooled
+                logger.info("Reusing pooled browser (headless=%s)", self.headless)
+            else:
+                self._playwright = await async_playwright().start()
+                
+                # Launch browser
+                self._browser = await self._playwright.chromium.launch(**self._launch_options)
+                
+                logger.info("Browser launched (headless=%s)", self.headless)
             
-            # Create context
-            context_options: Dict[str, Any] = {
-                "viewport": self.viewport,
-            }
-            
-            if self.user_agent:
-                context_options["user_agent"] = self.user_agent
-            
-            self._context = await self._browser.new_context(**context_options)
+            # Create context, restoring the session in the same call if given
+            if self.storage_state is not None:
+                self._context = await self._browser.new_context(
+                    storage_state=self.storage_state,
+                    **self._context_options
+                )
+                self._is_authenticated = True
+            else:
+                self._context = await self._browser.new_context(**self._context_options)
+            await self._prepare_context()
             
             # Create initial page
             self._page = await self._context.new_page()
+            self._schedule_page_pool_refill()
             
             logger.info("Browser context and page created")
             
         except Exception as e:
-            await self.close()
+            # Undo this call only; earlier start() calls still hold their
+            # count, but whatever this attempt launched has to go
+            self._start_count -= 1
+            await self._teardown()
             raise NetworkError(f"Failed to start browser: {e}")
     
     async def close(self) -> None:
         """Close browser and cleanup resources."""
+        if self._start_count > 1:
+            self._start_count -= 1
+            return
+        self._start_count = 0
+        
+        await self._teardown()
+    
+    async def _teardown(self) -> None:
+        """Close pages, context, browser and Playwright regardless of the start count."""
         try:
+            await self._clear_page_pool()
+            
             if self._page:
                 await self._page.close()
                 self._page = None
@@ -98,6 +414,13 @@ class BrowserManager:
                 await self._context.close()
                 self._context = None
             
+            if self.pool and self._browser and self._playwright and self._browser.is_connected():
+                self.pool.release(self._pool_key, self._playwright, self._browser)
+                self._browser = None
+                self._playwright = None
+                logger.info("Browser returned to pool")
+                return
+            
             if self._browser:
                 await self._browser.close()
                 self._browser = None
@@ -109,9 +432,58 @@ class BrowserManager:
             logger.info("Browser closed")
             
         except Exception as e:
-            logger.error(f"Error closing browser: {e}")
+            logger.error("Error closing browser: %s", e)
     
-    async def new_page(self) -> Page:
+    async def _discard_browser(self) -> None:
+        """Drop the objects of a disconnected browser without closing them."""
+        await self._clear_page_pool()
+        self._page = None
+        self._context = None
+        self._browser = None
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug("Error stopping Playwright: %s", e)
+            self._playwright = None
+    
+    async def _prepare_context(self) -> None:
+        """Apply per-context settings to a freshly created context."""
+        if self.block_assets:
+            from .utils import block_resources
+            
+            await block_resources(self._context)
+    
+    async def pause(self) -> None:
+        """
+        Free per-run resources but keep the browser and context alive.
+        
+        Closes every page except the main page and the page pool, and points
+        the main page at about:blank to release the previous DOM. Call close()
+        for a real shutdown.
+        """
+        if not self._context:
+            return
+        
+        try:
+            for page in list(self._context.pages):
+                if page is not self._page and page not in self._page_pool:
+                    await page.close()
+            
+            if self._page:
+                await self._page.goto("about:blank")
+            
+            logger.info("Browser paused")
+            
+        except Exception as e:
+            logger.error("Error pausing browser: %s", e)
+    
+    async def resume(self) -> None:
+        """Start the browser unless a paused context is still alive."""
+        if self._context is None or not (self._browser and self._browser.is_connected()):
+            await self.start()
+    
+    async def new_page(self) -> "Page":
         """
         Create a new page in the current context.
         
@@ -121,11 +493,49 @@ class BrowserManager:
         if not self._context:
             raise RuntimeError("Browser context not initialized. Call start() first.")
         
+        if self._page_pool:
+            page = self._page_pool.popleft()
+            self._schedule_page_pool_refill()
+            return page
+        
         page = await self._context.new_page()
         return page
     
+    def _schedule_page_pool_refill(self) -> None:
+        """Top up the blank page pool in the background."""
+        if self.page_pool_size <= 0:
+            return
+        if self._page_pool_task and not self._page_pool_task.done():
+            return
+        self._page_pool_task = asyncio.create_task(self._refill_page_pool())
+    
+    async def _refill_page_pool(self) -> None:
+        """Create blank pages until the pool is full."""
+        try:
+            while self._context and len(self._page_pool) < self.page_pool_size:
+                self._page_pool.append(await self._context.new_page())
+        except Exception as e:
+            logger.debug("Could not refill page pool: %s", e)
+    
+    async def _clear_page_pool(self) -> None:
+        """Cancel any pending refill and close pooled pages."""
+        if self._page_pool_task:
+            self._page_pool_task.cancel()
+            try:
+                await self._page_pool_task
+            except asyncio.CancelledError:
+                pass
+            self._page_pool_task = None
+        
+        while self._page_pool:
+            page = self._page_pool.popleft()
+            try:
+                await page.close()
+            except Exception:
+                pass
+    
     @property
-    def page(self) -> Page:
+    def page(self) -> "Page":
         """
         Get the main page.
         
@@ -137,7 +547,7 @@ class BrowserManager:
         return self._page
     
     @property
-    def context(self) -> BrowserContext:
+    def context(self) -> "BrowserContext":
         """
         Get the browser context.
         
@@ -149,7 +559,7 @@ class BrowserManager:
         return self._context
     
     @property
-    def browser(self) -> Browser:
+    def browser(self) -> "Browser":
         """
         Get the browser instance.
         
@@ -170,15 +580,16 @@ class BrowserManager:
         if not self._context:
             raise RuntimeError("No browser context to save")
         
-        storage_state = await self._context.storage_state()
-        
+        # Create the target directory while the driver serializes the state
         path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        storage_state, _ = await asyncio.gather(
+            self._context.storage_state(),
+            asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True),
+        )
         
-        with open(filepath, 'w') as f:
-            json.dump(storage_state, f, indent=2)
+        await asyncio.to_thread(_write_private_file, path, _dumps(storage_state))
         
-        logger.info(f"Session saved to {filepath}")
+        logger.info("Session saved to %s", filepath)
     
     async def load_session(self, filepath: str) -> None:
         """
@@ -187,10 +598,15 @@ class BrowserManager:
         Args:
             filepath: Path to session file
         """
-        if not Path(filepath).exists():
+        path = Path(filepath)
+        if not await asyncio.to_thread(path.exists):
             raise FileNotFoundError(f"Session file not found: {filepath}")
         
+        storage_state = _loads(await asyncio.to_thread(path.read_bytes))
+        storage_state["cookies"] = _dedupe_cookies(storage_state.get("cookies", []))
+        
         # Close existing context and create new one with stored state
+        await self._clear_page_pool()
         if self._context:
             await self._context.close()
         
@@ -198,19 +614,20 @@ class BrowserManager:
             raise RuntimeError("Browser not started")
         
         self._context = await self._browser.new_context(
-            storage_state=filepath,
-            viewport=self.viewport,
-            user_agent=self.user_agent
+            storage_state=storage_state,
+            **self._context_options
         )
+        await self._prepare_context()
         
         # Create new page
         if self._page:
             await self._page.close()
         self._page = await self._context.new_page()
+        self._schedule_page_pool_refill()
         
         self._is_authenticated = True
         
-        logger.info(f"Session loaded from {filepath}")
+        logger.info("Session loaded from %s", filepath)
     
     async def set_cookie(self, name: str, value: str, domain: str = ".linkedin.com") -> None:
         """
@@ -224,14 +641,69 @@ class BrowserManager:
         if not self._context:
             raise RuntimeError("No browser context")
         
-        await self._context.add_cookies([{
-            "name": name,
-            "value": value,
-            "domain": domain,
-            "path": "/"
-        }])
+        cookie = _make_cookie(name, value, domain)
+        
+        if self._pending_cookies is not None:
+            self._pending_cookies.append(cookie)
+            return
+        
+        await self._context.add_cookies([cookie])
+        
+        logger.debug("Cookie set: %s", name)
+    
+    async def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Set several cookies with as few driver round-trips as possible.
+        
+        Args:
+            cookies: Cookie dicts in Playwright's add_cookies() format
+        """
+        if not self._context:
+            raise RuntimeError("No browser context")
+        
+        cookies = _dedupe_cookies(cookies)
+        for i in range(0, len(cookies), _COOKIE_BATCH_SIZE):
+            await self._context.add_cookies(cookies[i:i + _COOKIE_BATCH_SIZE])
+        
+        logger.debug("%s cookies set", len(cookies))
+    
+    async def set_cookies_bulk(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        domain: str = ".linkedin.com"
+    ) -> None:
+        """
+        Set several name/value cookies on one domain in a single call.
+        
+        Args:
+            pairs: Iterable of (name, value) tuples
+            domain: Cookie domain
+        """
+        await self.set_cookies([_make_cookie(name, value, domain) for name, value in pairs])
+    
+    @asynccontextmanager
+    async def cookie_batch(self) -> AsyncIterator[None]:
+        """
+        Collect set_cookie() calls and send them in one batch on exit.
+        
+        Example:
+            async with browser.cookie_batch():
+                await browser.set_cookie("li_at", li_at)
+                await browser.set_cookie("JSESSIONID", jsessionid)
+        """
+        if self._pending_cookies is not None:
+            yield
+            return
+        
+        self._pending_cookies = []
+        try:
+            yield
+            pending = self._pending_cookies
+        finally:
+            self._pending_cookies = None
         
-        logger.debug(f"Cookie set: {name}")
+        if pending:
+            await self.set_cookies(pending)
     
     @property
     def is_authenticated(self) -> bool:
@@ -3,8 +3,15 @@
 import asyncio
 import functools
 import logging
-from typing import Any, Callable, Optional, TypeVar, cast
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+import weakref
+from typing import Any, Callable, Iterable, List, Optional, TypeVar, Union, cast
+from playwright.async_api import (
+    BrowserContext,
+    Page,
+    Route,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from .exceptions import RateLimitError, ElementNotFoundError, NetworkError
 
@@ -12,6 +19,57 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Resources a text scraper never needs
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Tracking/analytics endpoints LinkedIn pages keep polling
+BLOCKED_URL_PATTERNS = (
+    'px.ads.linkedin.com',
+    'platform.linkedin.com/litms',
+    'snap.licdn.com/li.lms-analytics',
+    'linkedin.com/li/track',
+    'google-analytics.com',
+    'doubleclick.net',
+)
+
+# Page texts LinkedIn shows when it throttles a session
+_RATE_LIMIT_PHRASES = (
+    'too many requests',
+    'rate limit',
+    'slow down',
+    'try again later',
+)
+
+# Pages and contexts that already carry the block_resources() route, so
+# BrowserManager and the scrapers sharing a context route it only once
+_BLOCKED_TARGETS: "weakref.WeakSet[Union[Page, BrowserContext]]" = weakref.WeakSet()
+
+# LinkedIn API calls the page renders from; never blocked
+ALLOWED_URL_PATTERNS = (
+    '/voyager/api/',
+)
+
+# Resolve once every selector matches, or with the selectors still missing
+# when the timeout fires. A single MutationObserver re-checks the pending
+# selectors on each DOM change, so all of them are awaited in one call.
+_WAIT_FOR_ALL_JS = '''([selectors, timeout]) => new Promise((resolve) => {
+    let pending = selectors.filter((s) => !document.querySelector(s));
+    if (!pending.length) return resolve([]);
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        pending = pending.filter((s) => !document.querySelector(s));
+        if (pending.length) return;
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve([]);
+    });
+    observer.observe(document, {childList: true, subtree: true});
+    timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(pending);
+    }, timeout);
+})'''
+
 
 def retry_async(
     max_attempts: int = 3,
@@ -91,12 +149,7 @@ async def detect_rate_limit(page: Page) -> None:
         body_text = await page.locator('body').text_content(timeout=1000)
         if body_text:
             body_lower = body_text.lower()
-            if any(phrase in body_lower for phrase in [
-                'too many requests',
-                'rate limit',
-                'slow down',
-                'try again later'
-            ]):
+            if any(phrase in body_lower for phrase in _RATE_LIMIT_PHRASES):
                 raise RateLimitError(
                     "Rate limit message detected on page.",
                     suggested_wait_time=1800  # 30 minutes
@@ -142,6 +195,47 @@ async def wait_for_element_smart(
         )
 
 
+async def wait_for_all(
+    page: Page,
+    selectors: Iterable[str],
+    timeout: float = 10000
+) -> List[str]:
+    """
+    Wait for several elements at once in a single round-trip.
+    
+    Unlike chained wait_for_selector() calls, the selectors are awaited in
+    parallel inside the page. Only plain CSS selectors are supported.
+    
+    Args:
+        page: Playwright page object
+        selectors: CSS selectors that should all become attached
+        timeout: Timeout in milliseconds
+        
+    Returns:
+        Selectors that were still missing when the timeout fired (empty if
+        all of them matched)
+    """
+    selectors = list(selectors)
+    try:
+        return await page.evaluate(_WAIT_FOR_ALL_JS, [selectors, timeout])
+    except PlaywrightError as e:
+        # A client-side redirect destroys the page the observer lived in;
+        # wait_for_selector() survives navigation, so fall back to it
+        if 'Execution context was destroyed' not in str(e):
+            raise
+        logger.debug(f"Page navigated while waiting, retrying per selector: {e}")
+    
+    async def attached(selector: str) -> bool:
+        try:
+            await page.wait_for_selector(selector, timeout=timeout, state='attached')
+            return True
+        except PlaywrightTimeoutError:
+            return False
+    
+    found = await asyncio.gather(*(attached(selector) for selector in selectors))
+    return [selector for selector, ok in zip(selectors, found) if not ok]
+
+
 def _get_selector_suggestions(selector: str) -> str:
     """Get helpful suggestions based on selector type."""
     if '#' in selector:
@@ -233,7 +327,8 @@ async def click_see_more_buttons(page: Page, max_attempts: int = 10) -> int:
                 clicked += 1
             else:
                 break
-        except:
+        except PlaywrightError as e:
+            logger.debug(f"Stopped clicking 'see more' buttons: {e}")
             break
     
     if clicked > 0:
@@ -265,8 +360,8 @@ async def handle_modal_close(page: Page) -> bool:
             await asyncio.sleep(0.5)
             logger.debug("Closed modal")
             return True
-    except:
-        pass
+    except PlaywrightError as e:
+        logger.debug(f"Could not close modal: {e}")
     
     return False
 
@@ -284,5 +379,52 @@ async def is_page_loaded(page: Page) -> bool:
     try:
         state = await page.evaluate('document.readyState')
         return state == 'complete'
-    except:
+    except PlaywrightError:
         return False
+
+
+async def block_resources(
+    target: Union[Page, BrowserContext],
+    resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+    url_patterns: Iterable[str] = BLOCKED_URL_PATTERNS,
+    allowed_patterns: Iterable[str] = ALLOWED_URL_PATTERNS
+) -> None:
+    """
+    Abort requests for heavy resources and trackers.
+    
+    Routing a browser context also covers pages opened on it later.
+    Requests that are not blocked fall through to any other route handlers.
+    The route is installed once per target; later calls are no-ops. Note
+    that Playwright disables the HTTP cache of routed pages and contexts.
+    
+    Args:
+        target: Playwright page or browser context
+        resource_types: Request resource types to abort (image, font, ...)
+        url_patterns: Substrings of request URLs to abort
+        allowed_patterns: Substrings of request URLs that always go through
+    """
+    if target in _BLOCKED_TARGETS:
+        return
+    
+    resource_types = frozenset(resource_types)
+    url_patterns = tuple(url_patterns)
+    allowed_patterns = tuple(allowed_patterns)
+    
+    async def handle(route: Route) -> None:
+        request = route.request
+        if any(pattern in request.url for pattern in allowed_patterns):
+            await route.fallback()
+        elif request.resource_type in resource_types or any(
+            pattern in request.url for pattern in url_patterns
+        ):
+            await route.abort()
+        else:
+            await route.fallback()
+    
+    # Mark before awaiting so concurrent callers do not route twice
+    _BLOCKED_TARGETS.add(target)
+    try:
+        await target.route('**/*', handle)
+    except Exception:
+        _BLOCKED_TARGETS.discard(target)
+        raise
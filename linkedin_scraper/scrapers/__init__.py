@@ -1,6 +1,7 @@
 """Scraper modules for LinkedIn."""
 
 from .base import BaseScraper
+from ._selectors import SELECTORS
 from .person import PersonScraper
 from .company import CompanyScraper
 from .job import JobScraper
@@ -14,4 +15,5 @@ __all__ = [
     'JobScraper',
     'JobSearchScraper',
     'CompanyPostsScraper',
+    'SELECTORS',
 ]
@@ -0,0 +1,68 @@
+"""
+Selectors used by the profile scrapers.
+
+Most entries are handed to Playwright locators and may use its selector
+syntax (``text="..."``, ``:has-text()``, ...). The keys in CSS_ONLY_KEYS are
+run with querySelector inside the page and must be plain CSS.
+"""
+
+import re
+from types import MappingProxyType
+from typing import Final, FrozenSet, Mapping
+
+_PAGED_LIST_ITEM = ".pvs-list__paged-list-item"
+_LIST_CONTAINER = ".pvs-list__container"
+
+# Built once at import and shared read-only by every scraper instance.
+# PersonScraper accepts a mapping of overrides for any of these keys. The
+# "name" and "location" entries are looked up inside <main>.
+SELECTORS: Final[Mapping[str, str]] = MappingProxyType({
+    "profile_marker": "main h1, [data-view-name='profile-main-level']",
+    "name": "h1",
+    "location": ".text-body-small.inline.t-black--light.break-words",
+    "list_container": _LIST_CONTAINER,
+    "paged_list_item": _PAGED_LIST_ITEM,
+    "detail_list_items": f"main li, {_PAGED_LIST_ITEM}",
+    "tab": '[role="tab"], tab',
+    "tabpanel": '[role="tabpanel"], tabpanel',
+    "interest_items": f"listitem, li, {_PAGED_LIST_ITEM}",
+    "dialog": 'dialog, [role="dialog"]',
+    "nothing_to_see": 'text="Nothing to see for now"',
+    "accomplishment_list": f"{_LIST_CONTAINER}, main ul, main ol",
+    # Paged items, or plain direct <li> children on the newer layout, in one query
+    "accomplishment_items": f"{_PAGED_LIST_ITEM}, :scope > li",
+})
+
+# Keys evaluated by document.querySelector in page scripts (_PROFILE_JS,
+# _INTEREST_PANELS_JS, wait_for_all) rather than by Playwright
+CSS_ONLY_KEYS: Final[FrozenSet[str]] = frozenset({
+    "profile_marker",
+    "name",
+    "location",
+    "interest_items",
+})
+
+# Playwright selector syntax that querySelector throws on: engine prefixes
+# (text=, xpath=, ...), XPath, chaining and Playwright-only pseudo-classes
+_PLAYWRIGHT_ONLY_RE = re.compile(
+    r"^\s*(?:[\w:-]+=|//|\.\.)|>>"
+    r"|:(?:has-text|text|text-is|text-matches|visible|nth-match"
+    r"|left-of|right-of|above|below|near)\b"
+)
+
+
+def validate_css_selectors(selectors: Mapping[str, str]) -> None:
+    """
+    Check that the entries page scripts query directly are plain CSS.
+    
+    Args:
+        selectors: Selector mapping (full table or overrides)
+        
+    Raises:
+        ValueError: If a CSS_ONLY_KEYS entry uses Playwright-only syntax
+    """
+    for key in CSS_ONLY_KEYS & selectors.keys():
+        if _PLAYWRIGHT_ONLY_RE.search(selectors[key]):
+            raise ValueError(
+                f"Selector {key!r} must be plain CSS, got {selectors[key]!r}"
+            )
@@ -2,12 +2,13 @@
 
 import asyncio
 import logging
-from typing import Optional
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from typing import Iterable, List, Optional
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 
 from ..callbacks import ProgressCallback, SilentCallback
 from ..core import (
     is_logged_in,
+    is_auth_blocked,
     detect_rate_limit,
     scroll_to_bottom,
     scroll_to_half,
@@ -15,11 +16,17 @@ from ..core import (
     handle_modal_close,
     extract_text_safe,
     retry_async,
+    wait_for_all,
 )
 from ..core.exceptions import AuthenticationError, ScrapingError
 
 logger = logging.getLogger(__name__)
 
+# Trimmed, non-empty rendered text of every matched element, read in one call
+_TEXTS_ALL_JS = """(els, maxLength) => els
+    .map((el) => (el.innerText || el.textContent || '').trim())
+    .filter((text) => text && (!maxLength || text.length < maxLength))"""
+
 
 class BaseScraper:
     """Base class with common scraping functionality."""
@@ -34,18 +41,28 @@ class BaseScraper:
         """
         self.page = page
         self.callback = callback or SilentCallback()
+        self._logged_in_confirmed = False
     
     async def ensure_logged_in(self) -> None:
         """
         Verify user is authenticated.
         
+        The nav element probes only run until the session has been confirmed
+        once; afterwards a redirect to a login/authwall page is still caught
+        from the URL.
+        
         Raises:
             AuthenticationError: If not logged in
         """
+        if self._logged_in_confirmed and not is_auth_blocked(self.page.url):
+            return
+        
         if not await is_logged_in(self.page):
+            self._logged_in_confirmed = False
             raise AuthenticationError(
                 "Not logged in. Please authenticate before scraping."
             )
+        self._logged_in_confirmed = True
     
     async def check_rate_limit(self) -> None:
         """
@@ -66,6 +83,54 @@ class BaseScraper:
         """
         await scroll_to_bottom(self.page, pause_time, max_scrolls)
     
+    async def wait_for_list_stable(
+        self,
+        selector: str,
+        stable_rounds: int = 2,
+        interval: float = 0.25,
+        max_rounds: int = 20
+    ) -> int:
+        """
+        Scroll to the bottom and wait until a lazy-loaded list stops growing.
+        
+        Args:
+            selector: CSS selector matching the list items
+            stable_rounds: Consecutive polls with an unchanged count required
+            interval: Time between polls in seconds
+            max_rounds: Maximum number of polls
+            
+        Returns:
+            Final number of matching items
+        """
+        previous = -1
+        stable = 0
+        for _ in range(max_rounds):
+            count = await self.page.locator(selector).count()
+            if count == previous:
+                stable += 1
+                if stable >= stable_rounds:
+                    break
+            else:
+                # New items may have pushed the page down; keep loading
+                previous = count
+                stable = 0
+                await self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            await asyncio.sleep(interval)
+        return previous
+    
+    async def wait_for_all(self, selectors: Iterable[str], timeout: float = 10000) -> List[str]:
+        """
+        Wait for several elements in parallel with a single page call.
+        
+        Args:
+            selectors: CSS selectors that should all become attached
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            Selectors still missing when the timeout fired
+        """
+        return await wait_for_all(self.page, selectors, timeout)
+    
     async def scroll_page_to_half(self) -> None:
         """Scroll to middle of page."""
         await scroll_to_half(self.page)
@@ -118,6 +183,20 @@ class BaseScraper:
         """
         return await extract_text_safe(self.page, selector, default, timeout)
     
+    async def extract_texts(self, locator: Locator, max_length: Optional[int] = None) -> List[str]:
+        """
+        Extract the text of every element a locator matches in one round-trip.
+        
+        Args:
+            locator: Playwright locator matching any number of elements
+            max_length: Drop texts of this length or longer (e.g. whole-page
+                containers) before they are sent back
+            
+        Returns:
+            Trimmed, non-empty texts in document order
+        """
+        return await locator.evaluate_all(_TEXTS_ALL_JS, max_length)
+    
     @retry_async(max_attempts=3, backoff=2.0, exceptions=(PlaywrightTimeoutError,))
     async def safe_click(self, selector: str, timeout: float = 5000) -> bool:
         """
@@ -219,7 +298,7 @@ class BaseScraper:
             element = self.page.locator(selector).first
             value = await element.get_attribute(attribute, timeout=timeout)
             return value if value else default
-        except:
+        except Exception:
             return default
     
     async def wait_and_focus(self, duration: float = 1.0) -> None:
@@ -233,7 +312,7 @@ class BaseScraper:
         try:
             # Bring page to front
             await self.page.bring_to_front()
-        except:
+        except Exception:
             pass
     
     async def count_elements(self, selector: str) -> int:
@@ -248,7 +327,7 @@ class BaseScraper:
         """
         try:
             return await self.page.locator(selector).count()
-        except:
+        except Exception:
             return 0
     
     async def element_exists(self, selector: str, timeout: float = 1000) -> bool:
@@ -265,5 +344,5 @@ class BaseScraper:
         try:
             await self.page.wait_for_selector(selector, timeout=timeout, state='attached')
             return True
-        except:
+        except Exception:
             return False
@@ -14,6 +14,13 @@ from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Content hints used to classify the top-card info items
+_HEADQUARTERS_HINTS = ('Washington', 'California', 'New York', 'Texas', 'United States', 'United Kingdom')
+_INDUSTRY_HINTS = ('software', 'technology', 'financial', 'healthcare', 'retail', 'manufacturing', 'consulting', 'education')
+
+# Link texts that point at the company's own website
+_WEBSITE_LINK_HINTS = ('learn more', 'website', 'visit')
+
 
 class CompanyScraper(BaseScraper):
     """
@@ -135,21 +142,21 @@ class CompanyScraper(BaseScraper):
         
         try:
             # LinkedIn's new structure (as of 2024+): Uses info items instead of dt/dd
-            info_items = await self.page.locator('.org-top-card-summary-info-list__info-item').all()
+            info_texts = await self.extract_texts(
+                self.page.locator('.org-top-card-summary-info-list__info-item')
+            )
             
-            for item in info_items:
-                text = await item.inner_text()
-                text = text.strip()
+            for text in info_texts:
                 text_lower = text.lower()
                 
                 # Detect what kind of information this is based on content patterns
                 if 'employee' in text_lower or 'k+' in text_lower:
                     # Company size (e.g., "10K+ employees", "1,001-5,000 employees")
                     overview['company_size'] = text
-                elif ',' in text and any(loc in text for loc in ['Washington', 'California', 'New York', 'Texas', 'United States', 'United Kingdom']):
+                elif ',' in text and any(loc in text for loc in _HEADQUARTERS_HINTS):
                     # Headquarters (e.g., "Redmond, Washington", "Mountain View, California")
                     overview['headquarters'] = text
-                elif any(ind in text_lower for ind in ['software', 'technology', 'financial', 'healthcare', 'retail', 'manufacturing', 'consulting', 'education']):
+                elif any(ind in text_lower for ind in _INDUSTRY_HINTS):
                     # Industry (e.g., "Software Development", "Financial Services")
                     overview['industry'] = text
                 elif 'follower' in text_lower:
@@ -165,7 +172,7 @@ class CompanyScraper(BaseScraper):
                     if href and 'linkedin' not in href and ('http' in href or 'www.' in href):
                         link_text = await link.inner_text()
                         # Skip navigation links, look for actual website URLs
-                        if link_text and any(word in link_text.lower() for word in ['learn more', 'website', 'visit']):
+                        if link_text and any(word in link_text.lower() for word in _WEBSITE_LINK_HINTS):
                             overview['website'] = href
                             break
             except Exception as e:
@@ -225,10 +225,7 @@ class CompanyPostsScraper(BaseScraper):
         match = re.search(r'(\d+[hdwmy]|\d+\s*(?:hour|day|week|month|year)s?\s*ago)', text, re.IGNORECASE)
         if match:
             return match.group(1).strip()
-        parts = text.split('•')
-        if parts:
-            return parts[0].strip()
-        return None
+        return text.partition('•')[0].strip()
     
     async def _parse_post_element(self, element) -> Optional[Post]:
         try:
@@ -279,7 +276,7 @@ class CompanyPostsScraper(BaseScraper):
                 if match:
                     return match.group(1).strip()
                 if text:
-                    clean_text = text.split('•')[0].strip()
+                    clean_text = text.partition('•')[0].strip()
                     return clean_text if clean_text else None
         except:
             pass
@@ -112,12 +112,10 @@ class JobScraper(BaseScraper):
         """Extract company name from company link."""
         try:
             # Find company links that have text (not just images)
-            company_links = await self.page.locator('a[href*="/company/"]').all()
-            for link in company_links:
-                text = await link.inner_text()
-                text = text.strip()
-                # Skip empty or very short text (likely image-only links)
-                if text and len(text) > 1 and not text.startswith('logo'):
+            texts = await self.extract_texts(self.page.locator('a[href*="/company/"]'))
+            for text in texts:
+                # Skip very short text (likely image-only links)
+                if len(text) > 1 and not text.startswith('logo'):
                     return text
         except:
             pass
@@ -130,8 +128,7 @@ class JobScraper(BaseScraper):
             if await company_link.count() > 0:
                 href = await company_link.get_attribute('href')
                 if href:
-                    if '?' in href:
-                        href = href.split('?')[0]
+                    href = href.partition('?')[0]
                     if not href.startswith('http'):
                         href = f"https://www.linkedin.com{href}"
                     return href
@@ -142,15 +139,13 @@ class JobScraper(BaseScraper):
     async def _get_location(self) -> Optional[str]:
         """Extract job location from job details panel."""
         try:
+            # No panel means no texts; evaluate_all does not wait for matches
             job_panel = self.page.locator('h1').first.locator('xpath=ancestor::*[5]')
-            if await job_panel.count() > 0:
-                text_elements = await job_panel.locator('span, div').all()
-                for elem in text_elements:
-                    text = await elem.inner_text()
-                    if text and (',' in text or 'Remote' in text or 'United States' in text):
-                        text = text.strip()
-                        if len(text) > 3 and len(text) < 100 and not text.startswith('$'):
-                            return text
+            texts = await self.extract_texts(job_panel.locator('span, div'), max_length=100)
+            for text in texts:
+                if ',' in text or 'Remote' in text or 'United States' in text:
+                    if len(text) > 3 and not text.startswith('$'):
+                        return text
         except:
             pass
         return None
@@ -158,13 +153,11 @@ class JobScraper(BaseScraper):
     async def _get_posted_date(self) -> Optional[str]:
         """Extract posted date from job details."""
         try:
-            text_elements = await self.page.locator('span, div').all()
-            for elem in text_elements:
-                text = await elem.inner_text()
-                if text and ('ago' in text.lower() or 'day' in text.lower() or 'week' in text.lower() or 'hour' in text.lower()):
-                    text = text.strip()
-                    if len(text) < 50:
-                        return text
+            texts = await self.extract_texts(self.page.locator('span, div'), max_length=50)
+            for text in texts:
+                text_lower = text.lower()
+                if 'ago' in text_lower or 'day' in text_lower or 'week' in text_lower or 'hour' in text_lower:
+                    return text
         except:
             pass
         return None
@@ -173,15 +166,11 @@ class JobScraper(BaseScraper):
         """Extract applicant count from job details."""
         try:
             main_content = self.page.locator('main').first
-            if await main_content.count() > 0:
-                text_elements = await main_content.locator('span, div').all()
-                for elem in text_elements:
-                    text = await elem.inner_text()
-                    text = text.strip()
-                    if text and len(text) < 50:
-                        text_lower = text.lower()
-                        if 'applicant' in text_lower or 'people clicked' in text_lower or 'applied' in text_lower:
-                            return text
+            texts = await self.extract_texts(main_content.locator('span, div'), max_length=50)
+            for text in texts:
+                text_lower = text.lower()
+                if 'applicant' in text_lower or 'people clicked' in text_lower or 'applied' in text_lower:
+                    return text
         except:
             pass
         return None
@@ -190,16 +179,11 @@ class JobScraper(BaseScraper):
         """Extract job description from article or about section."""
         try:
             about_heading = self.page.locator('h2:has-text("About the job")').first
-            if await about_heading.count() > 0:
-                article = about_heading.locator('xpath=ancestor::article[1]')
-                if await article.count() > 0:
-                    description = await article.inner_text()
-                    return description.strip()
-            
-            article = self.page.locator('article').first
-            if await article.count() > 0:
-                description = await article.inner_text()
-                return description.strip()
+            texts = await self.extract_texts(about_heading.locator('xpath=ancestor::article[1]'))
+            if not texts:
+                texts = await self.extract_texts(self.page.locator('article').first)
+            if texts:
+                return texts[0]
         except:
             pass
         return None
@@ -13,6 +13,20 @@ from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Unique absolute job URLs (query string dropped) in page order, deduplicated
+# in the page so repeated cards never cross the wire
+_JOB_URLS_JS = """(links, limit) => {
+    const urls = new Set();
+    for (const link of links) {
+        if (urls.size >= limit) break;
+        const href = link.getAttribute('href');
+        if (!href || !href.includes('/jobs/view/')) continue;
+        const url = href.split('?')[0];
+        urls.add(url.startsWith('http') ? url : `https://www.linkedin.com${url}`);
+    }
+    return Array.from(urls);
+}"""
+
 
 class JobSearchScraper(BaseScraper):
     """
@@ -114,30 +128,8 @@ class JobSearchScraper(BaseScraper):
         
         try:
             # Find all job cards/links
-            job_links = await self.page.locator('a[href*="/jobs/view/"]').all()
-            
-            seen_urls = set()
-            for link in job_links:
-                if len(job_urls) >= limit:
-                    break
-                
-                try:
-                    href = await link.get_attribute('href')
-                    if href and '/jobs/view/' in href:
-                        # Clean URL (remove query params)
-                        clean_url = href.split('?')[0] if '?' in href else href
-                        
-                        # Ensure full URL
-                        if not clean_url.startswith('http'):
-                            clean_url = f"https://www.linkedin.com{clean_url}"
-                        
-                        # Avoid duplicates
-                        if clean_url not in seen_urls:
-                            job_urls.append(clean_url)
-                            seen_urls.add(clean_url)
-                except Exception as e:
-                    logger.debug(f"Error extracting job URL: {e}")
-                    continue
+            job_links = self.page.locator('a[href*="/jobs/view/"]')
+            job_urls = await job_links.evaluate_all(_JOB_URLS_JS, limit)
         
         except Exception as e:
             logger.warning(f"Error extracting job URLs: {e}")
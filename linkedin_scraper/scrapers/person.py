@@ -1,30 +1,675 @@
 """Person/Profile scraper for LinkedIn."""
 
+import asyncio
+import calendar
+import functools
 import logging
-from typing import Optional
-from urllib.parse import urljoin
-from playwright.async_api import Page
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Mapping, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .base import BaseScraper
+from ._selectors import SELECTORS, validate_css_selectors
 from ..models import Person, Experience, Education, Accomplishment, Interest, Contact
 from ..callbacks import ProgressCallback, SilentCallback
-from ..core.exceptions import ScrapingError
+from ..core.exceptions import ElementNotFoundError, ScrapingError
+from ..core import BrowserContextPool, block_resources
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Locator, Page
 
 logger = logging.getLogger(__name__)
 
+# Locate several main-page profile sections with a single pass over the h2s.
+# Maps each heading (matched case-insensitively) to the nearest ancestor of
+# its h2 that holds a list; headings that are not on the page are left out.
+# The walk never descends into lists or icons, where section headings do not
+# live and most of the profile's nodes do.
+_FIND_SECTIONS_JS = """(headings) => {
+    const root = document.querySelector('main') || document;
+    const skipped = new Set(['UL', 'OL', 'SVG', 'svg']);
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT, {
+        acceptNode: (node) => {
+            if (skipped.has(node.tagName)) return NodeFilter.FILTER_REJECT;
+            return node.tagName === 'H2' ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+        },
+    });
+
+    const sections = {};
+    const pending = headings.map((heading) => [heading, heading.toLowerCase()]);
+    for (let h2 = walker.nextNode(); h2 && pending.length; h2 = walker.nextNode()) {
+        const text = (h2.textContent || '').toLowerCase();
+        for (let i = pending.length - 1; i >= 0; i--) {
+            const [heading, needle] = pending[i];
+            if (!text.includes(needle)) continue;
+            pending.splice(i, 1);
+            let section = h2.parentElement;
+            while (section && !section.querySelector('ul, ol')) section = section.parentElement;
+            if (section) sections[heading] = section;
+        }
+    }
+    return sections;
+}"""
+
+# Unique texts of an element, skipping parent/child overlap (a text that
+# contains, or is contained in, an already kept text longer than 3 chars).
+# Exact repeats are rejected by the Set; only the few kept long texts are
+# scanned for containment.
+_UNIQUE_TEXTS_JS = """(root) => {
+    let nodes = root.querySelectorAll('span[aria-hidden="true"], div > span');
+    if (!nodes.length) nodes = root.querySelectorAll('span, div');
+    const seen = new Set();
+    const long = [];
+    const texts = [];
+    for (const node of nodes) {
+        const text = (node.textContent || '').trim();
+        if (!text || text.length >= 200 || seen.has(text)) continue;
+        seen.add(text);
+        if (long.some((t) => text.includes(t) || t.includes(text))) continue;
+        if (text.length > 3) long.push(text);
+        texts.push(text);
+    }
+    return texts;
+}"""
+
+# Snapshot every list item of a main-page profile section root. Each item
+# reports the href of its first link, its link count and the unique texts of
+# its detail link.
+_SECTION_LIST_JS = "(section) => {\n    const uniqueTexts = " + _UNIQUE_TEXTS_JS + """;
+
+    return Array.from(section.querySelectorAll('ul > li, ol > li')).map((item) => {
+        const links = item.querySelectorAll('a');
+        const detail = links[1] || links[0];
+        return {
+            href: links.length ? links[0].getAttribute('href') : null,
+            linkCount: links.length,
+            texts: detail ? uniqueTexts(detail) : [],
+        };
+    });
+}"""
+
+# Open to work badge (profile picture title) and the About card text. The
+# About card's first aria-hidden span is its heading, the second its content.
+# The text is cut to aboutLimit characters in the page, when one is given.
+_TOP_CARD_JS = """(aboutLimit) => {
+    const root = document.querySelector('main') || document;
+    const img = root.querySelector('.pv-top-card-profile-picture img');
+    const title = img ? img.getAttribute('title') || '' : '';
+
+    let about = null;
+    for (const card of root.querySelectorAll('[data-view-name="profile-card"]')) {
+        if (!card.innerText.trim().startsWith('About')) continue;
+        const spans = card.querySelectorAll('span[aria-hidden="true"]');
+        if (spans.length > 1) {
+            about = spans[1].textContent.trim();
+            if (aboutLimit) about = about.slice(0, aboutLimit);
+            break;
+        }
+    }
+
+    return {openToWork: title.toUpperCase().includes('#OPEN_TO_WORK'), about: about};
+}"""
+
+# Everything the main profile page shows, read in a single round-trip after
+# it has been scrolled: the header fields (one selector each, keyed by field
+# name), top card and the Experience/Education items.
+_PROFILE_JS = (
+    "({fields: fieldSelectors, aboutLimit}) => {\n"
+    "    const topCard = " + _TOP_CARD_JS + ";\n"
+    "    const findSections = " + _FIND_SECTIONS_JS + ";\n"
+    "    const readSection = " + _SECTION_LIST_JS + ";\n"
+    """
+    const root = document.querySelector('main') || document;
+    const text = (selector) => {
+        const el = root.querySelector(selector);
+        return el ? (el.textContent || '').trim() : '';
+    };
+    const card = topCard(aboutLimit);
+    const sections = findSections(['Experience', 'Education']);
+    const items = (heading) => sections[heading] ? readSection(sections[heading]) : [];
+    const fields = {};
+    for (const [field, selector] of Object.entries(fieldSelectors)) fields[field] = text(selector);
+
+    return {
+        ...fields,
+        title: document.title,
+        openToWork: card.openToWork,
+        about: card.about,
+        experiences: items('Experience'),
+        educations: items('Education'),
+    };
+}"""
+)
+
+# Read a details-page profile entity (logo link + header spans + optional
+# description or nested position list) in one evaluate. Returns null when the
+# item is not an entity.
+_ENTITY_JS = """(item) => {
+    const headerTexts = (container) => {
+        const wrapper = container && container.firstElementChild;
+        if (!wrapper) return [];
+        return Array.from(wrapper.children).map((span) => {
+            const aria = span.querySelector('span[aria-hidden="true"]');
+            return aria ? aria.textContent : '';
+        });
+    };
+
+    const entity = item.querySelector('div[data-view-name="profile-component-entity"]');
+    if (!entity || entity.children.length < 2) return null;
+
+    const link = entity.children[0].querySelector('a');
+    const details = entity.children[1].children;
+    if (!details.length) return null;
+
+    const extra = details[1] || null;
+    const nestedList = extra && extra.querySelector('.pvs-list__container');
+    let positions = null;
+    if (nestedList) {
+        positions = [];
+        for (const position of nestedList.querySelectorAll('.pvs-list__paged-list-item')) {
+            const anchor = position.querySelector('a');
+            if (!anchor || !anchor.children.length) continue;
+            positions.push({
+                header: headerTexts(anchor.children[0]),
+                description: anchor.children[1] ? anchor.children[1].innerText : '',
+            });
+        }
+    }
+
+    return {
+        url: link ? link.getAttribute('href') : null,
+        header: headerTexts(details[0]),
+        description: extra ? extra.innerText : '',
+        positions: positions,
+    };
+}"""
+
+# Snapshot details-page list items in one round-trip so later DOM re-renders
+# cannot shift or detach them mid-parse. Each item carries its link info, the
+# unique texts of its detail link and the _ENTITY_JS reading of the item.
+_LIST_ITEMS_JS = "(items) => {\n    const readEntity = " + _ENTITY_JS + """;
+
+    return items.map((item) => {
+        const links = item.querySelectorAll('a, link');
+        const detail = links[1] || links[0];
+        const seen = new Set();
+        const texts = [];
+        if (detail) {
+            for (const node of detail.querySelectorAll('generic, span, div')) {
+                const text = (node.textContent || '').trim();
+                if (!text || text.length >= 200 || seen.has(text)) continue;
+                seen.add(text);
+                texts.push(text);
+            }
+        }
+        return {
+            href: links.length ? links[0].getAttribute('href') : null,
+            linkCount: links.length,
+            texts: texts,
+            entity: readEntity(item),
+        };
+    });
+}"""
+
+# Snapshot of interest list items: first link's href plus unique texts.
+_INTEREST_ITEMS_JS = "(items) => {\n    const uniqueTexts = " + _UNIQUE_TEXTS_JS + """;
+
+    return items.map((item) => {
+        const link = item.querySelector('a, link');
+        return {href: link ? link.getAttribute('href') : null, texts: uniqueTexts(item)};
+    });
+}"""
+
+# Snapshot the items of the open tab panel in one round-trip.
+_INTEREST_LIST_JS = "(items) => {\n    const readItems = " + _INTEREST_ITEMS_JS + """;
+
+    // Skip display:none copies and collapsed rows, which have no boxes
+    return readItems(items.filter((item) => item.getClientRects().length));
+}"""
+
+# Every interest tab's name and the items of its panel, without clicking.
+# LinkedIn usually renders all panels and hides the inactive ones, so rows
+# are only skipped when hidden inside their panel. A tab whose panel is not
+# in the DOM comes back with no items.
+_INTEREST_PANELS_JS = "(tabs, itemSelector) => {\n    const readItems = " + _INTEREST_ITEMS_JS + """;
+    const shownIn = (el, panel) => {
+        for (let node = el; node && node !== panel; node = node.parentElement) {
+            if (node.hidden || getComputedStyle(node).display === 'none') return false;
+        }
+        return true;
+    };
+
+    return tabs.map((tab) => {
+        const id = tab.getAttribute('aria-controls');
+        const panel = id ? document.getElementById(id) : null;
+        const items = panel
+            ? Array.from(panel.querySelectorAll(itemSelector)).filter((item) => shownIn(item, panel))
+            : [];
+        return {name: (tab.textContent || '').trim(), items: readItems(items)};
+    });
+}"""
+
+# Every section of the contact-info dialog in one round-trip: the h3 heading,
+# the links and span texts of its parent, and the parent's full text.
+_CONTACT_SECTIONS_JS = """(dialog) => Array.from(dialog.querySelectorAll('h3')).map((h3) => {
+    const section = h3.parentElement;
+    return {
+        heading: h3.textContent || '',
+        links: Array.from(section.querySelectorAll('a')).map((a) => ({
+            href: a.getAttribute('href'),
+            text: a.textContent,
+        })),
+        texts: Array.from(section.querySelectorAll('span, generic')).map((el) => el.textContent || ''),
+        text: section.textContent || '',
+    };
+})"""
+
+# Scroll to the bottom until the page height stops changing, all inside the
+# page. Waits for a frame (capped, background tabs may not paint) plus a
+# short settle interval between checks; returns the final height.
+_BULK_SCROLL_JS = """async ({interval, stableRounds, maxRounds}) => {
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const frame = () => Promise.race([
+        new Promise((resolve) => requestAnimationFrame(() => resolve())),
+        sleep(100),
+    ]);
+
+    let previous = -1;
+    let stable = 0;
+    for (let i = 0; i < maxRounds && stable < stableRounds; i++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await frame();
+        await sleep(interval);
+        const height = document.body.scrollHeight;
+        stable = height === previous ? stable + 1 : 0;
+        previous = height;
+    }
+    return previous;
+}"""
+
+# First five aria-hidden texts of each accomplishment item (from its entity
+# block when it has one) plus its credential link, one round-trip per list.
+_ACCOMPLISHMENT_ITEMS_JS = """(items) => items.map((item) => {
+    const entity = item.querySelector('div[data-view-name="profile-component-entity"]') || item;
+    const spans = Array.from(entity.querySelectorAll('span[aria-hidden="true"]')).slice(0, 5);
+    const link = item.querySelector('a[href*="credential"], a[href*="verify"]');
+    return {
+        spans: spans.map((span) => span.textContent),
+        credentialUrl: link ? link.getAttribute('href') : null,
+    };
+})"""
+
+# (details page path, Accomplishment category) per accomplishment section
+_ACCOMPLISHMENT_SECTIONS = (
+    ("certifications", "certification"),
+    ("honors", "honor"),
+    ("publications", "publication"),
+    ("patents", "patent"),
+    ("courses", "course"),
+    ("projects", "project"),
+    ("languages", "language"),
+    ("organizations", "organization"),
+)
+
+# Header fields read by _PROFILE_JS, each through the SELECTORS entry of the
+# same name
+_PROFILE_FIELDS = ("name", "location")
+
+# LinkedIn's internal JSON API, used by its own web app
+_VOYAGER_API_URL = "https://www.linkedin.com/voyager/api/"
+
+
+# "<from> - <to> · <duration>": " - " separates the dates and "·" the
+# duration; both parts are optional. Only the first two " - " parts and the
+# first two "·" segments count ("... · 1 yr · Remote" has duration "1 yr")
+_WORK_TIMES_RE = re.compile(
+    r"^(?P<from>[^·]*?)(?: - (?P<to>(?:(?! - )[^·])*)[^·]*)?"
+    r"(?:·(?P<duration>[^·]*))?(?:·|$)"
+)
+
+# Unread-notification counter LinkedIn prefixes to page titles, e.g. "(3) "
+_TITLE_BADGE_RE = re.compile(r"^\(\d+\+?\)\s*")
+
+# Interest tab name keyword, captured under the category it maps to
+_INTEREST_TAB_RE = re.compile(
+    r"(?P<company>compan)|(?P<group>group)|(?P<school>school)"
+    r"|(?P<newsletter>newsletter)|(?P<influencer>voice|influencer)"
+)
+
+# Separator of an education range; LinkedIn uses both "-" and "–"
+_EDUCATION_RANGE_RE = re.compile(r"\s+[-–]\s+")
+
+# "(Work)"-style label next to a contact entry
+_CONTACT_LABEL_RE = re.compile(r"\((.*)\)", re.DOTALL)
+
+# Issuer, issue date and credential lines of an accomplishment, told apart
+# by which outer group matched
+_ACCOMPLISHMENT_LINE_RE = re.compile(
+    r"(?P<issued_by>Issued by(?P<issuer>[^·]*)(?:·(?P<date>[^·]*))?)"
+    r"|(?P<issued>Issued (?P<issued_date>.*))"
+    r"|(?P<credential>Credential ID (?P<credential_id>.*))"
+)
+
+# Month name or abbreviation anywhere in an accomplishment date line
+# ("Mar 2021 · ...", "September 2020")
+_MONTH_RE = re.compile(r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec")
+
+# A bare duration such as "5 yrs 2 mos" (grouped company headers show one
+# instead of a date range)
+_DURATION_ONLY_RE = re.compile(r"^\d+\s+(?:yrs?|mos?)(?:\s+\d+\s+(?:yrs?|mos?))?$")
+
+
+def _profile_base_url(linkedin_url: str) -> str:
+    """
+    Normalize a profile URL into a base for its subpages.
+
+    Drops any query string or fragment and guarantees a trailing slash, so
+    ``f"{base}details/experience/"`` stays under the profile path (``urljoin``
+    replaces the last segment when the slash is missing).
+    """
+    parts = urlsplit(linkedin_url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/") + "/", "", ""))
+
+
+def _name_from_title(title: str) -> str:
+    """
+    Recover a profile name from the page title when the h1 is empty.
+
+    Examples:
+    - "Bill Gates | LinkedIn" -> "Bill Gates"
+    - "(3) Bill Gates | LinkedIn" -> "Bill Gates"
+    - "LinkedIn" -> ""
+    """
+    name, sep, _ = title.rpartition(" | LinkedIn")
+    if not sep:
+        return ""
+    return _TITLE_BADGE_RE.sub("", name).strip()
+
+
+def _contacts_from_api(data: dict, base_url: str) -> list[Contact]:
+    """
+    Map a Voyager profileContactInfo response to contacts.
+
+    Args:
+        data: Decoded JSON response
+        base_url: Normalized profile URL, reported as the LinkedIn contact
+
+    Returns:
+        Contacts in the order the contact-info dialog lists them
+    """
+    contacts = [Contact(type="linkedin", value=base_url)]
+
+    for website in data.get("websites") or []:
+        if not website.get("url"):
+            continue
+        # {"...StandardWebsite": {"category": "COMPANY"}} or
+        # {"...CustomWebsite": {"label": "Blog"}}
+        label = None
+        for detail in (website.get("type") or {}).values():
+            label = detail.get("label") or (detail.get("category") or "").capitalize() or None
+        contacts.append(Contact(type="website", value=website["url"], label=label))
+
+    if data.get("emailAddress"):
+        contacts.append(Contact(type="email", value=data["emailAddress"]))
+
+    for phone in data.get("phoneNumbers") or []:
+        if phone.get("number"):
+            label = (phone.get("type") or "").capitalize() or None
+            contacts.append(Contact(type="phone", value=phone["number"], label=label))
+
+    for handle in data.get("twitterHandles") or []:
+        if handle.get("name"):
+            contacts.append(Contact(type="twitter", value=handle["name"]))
+
+    birthday = data.get("birthDateOn") or {}
+    if birthday.get("month") and birthday.get("day"):
+        value = f"{calendar.month_name[birthday['month']]} {birthday['day']}"
+        contacts.append(Contact(type="birthday", value=value))
+
+    if data.get("address"):
+        contacts.append(Contact(type="address", value=data["address"].strip()))
+
+    return contacts
+
+
+def _merge_selectors(overrides: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+    """
+    Apply selector overrides on top of SELECTORS.
+
+    A mapping that already covers every key (SELECTORS itself, or the result
+    of an earlier merge) is returned as is, so scrapers sharing one do not
+    copy it again.
+
+    Raises:
+        ValueError: If an entry of CSS_ONLY_KEYS is not plain CSS
+    """
+    if overrides is None or overrides is SELECTORS:
+        return SELECTORS
+    validate_css_selectors(overrides)
+    if SELECTORS.keys() <= overrides.keys():
+        return overrides
+    return MappingProxyType({**SELECTORS, **overrides})
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_work_times(
+    work_times: str,
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Split a work times string into from_date, to_date, duration.
+
+    Cached because the same ranges ("2015 - Present") repeat across positions
+    and profiles.
+    """
+    try:
+        match = _WORK_TIMES_RE.match(work_times.strip())
+        from_date = match["from"].strip()
+        to_date = (match["to"] or "").strip()
+        duration = match["duration"]
+
+        if duration is None and not to_date and _DURATION_ONLY_RE.match(from_date):
+            return None, None, from_date
+
+        return from_date, to_date, duration.strip() if duration is not None else None
+    except Exception as e:
+        logger.debug(f"Error parsing work times '{work_times}': {e}")
+        return None, None, None
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_education_times(times: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Split an education times string into from_date, to_date.
+
+    Cached because graduation years repeat heavily across profiles.
+    """
+    try:
+        # Split before stripping so an open range ("2015 - ") still matches
+        parts = _EDUCATION_RANGE_RE.split(times)
+        from_date = parts[0]
+        # Single year when there is no range separator
+        to_date = parts[1] if len(parts) > 1 else from_date
+
+        return from_date.strip(), to_date.strip()
+    except Exception as e:
+        logger.debug(f"Error parsing education times '{times}': {e}")
+        return None, None
+
 
 class PersonScraper(BaseScraper):
     """Async scraper for LinkedIn person profiles."""
 
-    def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
+    def __init__(
+        self,
+        page: "Page",
+        callback: Optional[ProgressCallback] = None,
+        max_concurrency: int = 1,
+        block_resources: bool = False,
+        page_slots: Optional[asyncio.Semaphore] = None,
+        use_voyager_api: bool = True,
+        selectors: Optional[Mapping[str, str]] = None,
+        about_limit: Optional[int] = None,
+    ):
         """
         Initialize person scraper.
 
         Args:
             page: Playwright page object
             callback: Progress callback
+            max_concurrency: Maximum number of pages used at once. The default
+                of 1 scrapes everything serially on ``page``; higher values
+                fetch the sections that live on their own subpages on extra
+                tabs of the same browser context, at the cost of more
+                simultaneous requests to LinkedIn.
+            block_resources: Abort image, font, media and tracker requests on
+                the page's browser context before scraping. This routes the
+                context for good (disabling its HTTP cache), so it is off by
+                default; prefer BrowserManager(block_assets=True)
+            page_slots: Semaphore bounding extra pages, shared between
+                scrapers to cap them across concurrent scrape() calls.
+                Defaults to one of max_concurrency - 1 slots per scrape
+            use_voyager_api: Read contact info from LinkedIn's internal JSON
+                API with the session cookies, falling back to the contact-info
+                dialog when the call fails. Set False to only read pages
+            selectors: Overrides for entries of SELECTORS, e.g. after a
+                LinkedIn layout change. Merged once here, not per lookup
+            about_limit: Maximum number of About characters to read; longer
+                summaries are truncated in the page. None reads all of it
         """
         super().__init__(page, callback)
+        self.max_concurrency = max_concurrency
+        self.block_resources = block_resources
+        self.page_slots = page_slots
+        self.use_voyager_api = use_voyager_api
+        self.selectors = _merge_selectors(selectors)
+        self.about_limit = about_limit
+        self._owns_page = False
+
+    @classmethod
+    async def from_context(
+        cls,
+        context: "BrowserContext",
+        callback: Optional[ProgressCallback] = None,
+        max_concurrency: int = 1,
+        block_resources: bool = False,
+        page_slots: Optional[asyncio.Semaphore] = None,
+        use_voyager_api: bool = True,
+        selectors: Optional[Mapping[str, str]] = None,
+        about_limit: Optional[int] = None,
+    ) -> "PersonScraper":
+        """
+        Create a scraper on a new page of an existing browser context.
+
+        Scrapers created from the same context share its cookies, HTTP cache
+        and connections, so only the first profile pays for a cold cache.
+        Routing the context (block_resources, or BrowserManager with
+        block_assets=True) disables that cache in Playwright. Call close()
+        when done.
+
+        Args:
+            context: Browser context to open the page in
+            callback: Progress callback
+            max_concurrency: Maximum number of pages used at once
+            block_resources: Abort image, font, media and tracker requests
+            page_slots: Semaphore bounding extra pages across scrapers
+            use_voyager_api: Read contact info from LinkedIn's JSON API
+            selectors: Overrides for entries of SELECTORS
+            about_limit: Maximum number of About characters to read
+
+        Returns:
+            PersonScraper owning the new page
+        """
+        page = await context.new_page()
+        scraper = cls(
+            page,
+            callback=callback,
+            max_concurrency=max_concurrency,
+            block_resources=block_resources,
+            page_slots=page_slots,
+            use_voyager_api=use_voyager_api,
+            selectors=selectors,
+            about_limit=about_limit,
+        )
+        scraper._owns_page = True
+        return scraper
+
+    @classmethod
+    async def scrape_many(
+        cls,
+        context: Union["BrowserContext", BrowserContextPool],
+        linkedin_urls: Iterable[str],
+        concurrency: int = 4,
+        callback: Optional[ProgressCallback] = None,
+        max_concurrency: int = 1,
+        block_resources: bool = False,
+        max_extra_pages: Optional[int] = None,
+        use_voyager_api: bool = True,
+        selectors: Optional[Mapping[str, str]] = None,
+        about_limit: Optional[int] = None,
+    ) -> list[Union[Person, BaseException]]:
+        """
+        Scrape several profiles concurrently on pages of one browser context.
+
+        Args:
+            context: Logged-in browser context, or a BrowserContextPool to
+                check a context out of for each profile
+            linkedin_urls: LinkedIn profile URLs
+            concurrency: Maximum number of profiles scraped at once. Keep it
+                low; LinkedIn rate-limits long before the browser struggles
+            callback: Progress callback shared by all profiles
+            max_concurrency: Pages each profile may use for its subpages
+                (see __init__); 1 keeps it to one page per profile
+            block_resources: Abort image, font, media and tracker requests
+            max_extra_pages: Cap on subpage tabs open at once across the
+                whole batch, on top of one page per profile. Defaults to
+                concurrency * (max_concurrency - 1)
+            use_voyager_api: Read contact info from LinkedIn's JSON API
+            selectors: Overrides for entries of SELECTORS
+            about_limit: Maximum number of About characters to read
+
+        Returns:
+            One entry per URL, in order: the Person, or the exception that
+            scrape raised for it
+        """
+        slots = asyncio.BoundedSemaphore(concurrency)
+        selectors = _merge_selectors(selectors)
+        page_slots = None
+        if max_concurrency > 1 and max_extra_pages is not None:
+            page_slots = asyncio.Semaphore(max_extra_pages)
+
+        async def scrape_in(browser_context: "BrowserContext", linkedin_url: str) -> Person:
+            scraper = await cls.from_context(
+                browser_context,
+                callback=callback,
+                max_concurrency=max_concurrency,
+                block_resources=block_resources,
+                page_slots=page_slots,
+                use_voyager_api=use_voyager_api,
+                selectors=selectors,
+                about_limit=about_limit,
+            )
+            try:
+                return await scraper.scrape(linkedin_url)
+            finally:
+                await scraper.close()
+
+        async def scrape_one(linkedin_url: str) -> Person:
+            async with slots:
+                if isinstance(context, BrowserContextPool):
+                    async with context.acquire() as pooled:
+                        return await scrape_in(pooled, linkedin_url)
+                return await scrape_in(context, linkedin_url)
+
+        return await asyncio.gather(
+            *(scrape_one(url) for url in linkedin_urls), return_exceptions=True
+        )
+
+    async def close(self) -> None:
+        """Close the page if this scraper opened it (see from_context)."""
+        if self._owns_page and not self.page.is_closed():
+            await self.page.close()
 
     async def scrape(self, linkedin_url: str) -> Person:
         """
@@ -41,8 +686,15 @@ class PersonScraper(BaseScraper):
             ScrapingError: If scraping fails
         """
         await self.callback.on_start("person", linkedin_url)
+        base_url = _profile_base_url(linkedin_url)
 
         try:
+            # Text is all we read; skip images, fonts and trackers on every
+            # page of the context, sibling tabs included. A context that
+            # BrowserManager(block_assets=True) already routes is left as is
+            if self.block_resources:
+                await block_resources(self.page.context)
+
             # Navigate to profile first (this loads the page with our session)
             await self.navigate_and_wait(linkedin_url)
             await self.callback.on_progress("Navigated to profile", 10)
@@ -50,167 +702,284 @@ class PersonScraper(BaseScraper):
             # Now check if logged in
             await self.ensure_logged_in()
 
-            # Wait for main content
-            await self.page.wait_for_selector("main", timeout=10000)
-            await self.wait_and_focus(1)
-
-            # Get name and location
-            name, location = await self._get_name_and_location()
-            await self.callback.on_progress(f"Got name: {name}", 20)
+            # Accomplishments and contacts always live on their own subpages,
+            # so load them on sibling tabs while the profile page is parsed.
+            # Contacts is a single page, so it queues ahead of the eight
+            # accomplishment sections.
+            slots = None
+            detached = None
+            if self.max_concurrency > 1:
+                slots = self.page_slots
+                if slots is None:
+                    slots = asyncio.Semaphore(self.max_concurrency - 1)
+                detached = asyncio.ensure_future(
+                    asyncio.gather(
+                        self._get_contacts(base_url, slots),
+                        self._get_accomplishments(base_url, slots),
+                        return_exceptions=True,
+                    )
+                )
 
-            # Check open to work
-            open_to_work = await self._check_open_to_work()
+            try:
+                person = await self._scrape_profile(
+                    linkedin_url, base_url, detached, slots
+                )
+            finally:
+                # Let the sibling pages close before returning or raising;
+                # awaiting a finished future also retrieves its outcome
+                if detached is not None:
+                    detached.cancel()
+                    await asyncio.gather(detached, return_exceptions=True)
 
-            # Get about
-            about = await self._get_about()
-            await self.callback.on_progress("Got about section", 30)
+            await self.callback.on_progress("Scraping complete", 100)
+            await self.callback.on_complete("person", person)
 
-            # Scroll to load content
-            await self.scroll_page_to_half()
-            await self.scroll_page_to_bottom(pause_time=0.5, max_scrolls=3)
+            return person
 
-            # Get experiences
-            experiences = await self._get_experiences(linkedin_url)
-            await self.callback.on_progress(f"Got {len(experiences)} experiences", 60)
+        except Exception as e:
+            await self.callback.on_error(e)
+            raise ScrapingError(f"Failed to scrape person profile: {e}")
 
-            educations = await self._get_educations(linkedin_url)
-            await self.callback.on_progress(f"Got {len(educations)} educations", 50)
+    async def _scrape_profile(
+        self,
+        linkedin_url: str,
+        base_url: str,
+        detached: Optional[Awaitable[list]] = None,
+        slots: Optional[asyncio.Semaphore] = None,
+    ) -> Person:
+        """
+        Scrape the profile the page is currently on.
 
-            interests = await self._get_interests(linkedin_url)
-            await self.callback.on_progress(f"Got {len(interests)} interests", 65)
+        Args:
+            linkedin_url: LinkedIn profile URL
+            base_url: Normalized profile URL used to build subpage URLs
+            detached: Pending (contacts, accomplishments) results fetched on
+                sibling pages, each a list or the exception it failed with,
+                or None to fetch them on this page
+            slots: Semaphore bounding extra pages for details-page fallbacks,
+                or None to load them on this page
 
-            accomplishments = await self._get_accomplishments(linkedin_url)
-            await self.callback.on_progress(
-                f"Got {len(accomplishments)} accomplishments", 85
+        Returns:
+            Person object with all scraped data
+        """
+        # Wait for the profile header rather than a fixed delay or full load;
+        # <main> alone is enough when the header markup is not recognized
+        missing = await self.wait_for_all(["main", self.selectors["profile_marker"]])
+        if "main" in missing:
+            raise ElementNotFoundError("Profile page did not render")
+        if missing:
+            logger.debug("Profile heading did not render")
+        await self.wait_and_focus(0)
+
+        # Scroll to lazy-load the lower profile sections
+        await self._bulk_scroll()
+
+        # Read every section the main profile page already shows before
+        # anything navigates away from it
+        profile = await self._snapshot_profile()
+
+        name = profile["name"] or _name_from_title(profile["title"]) or "Unknown"
+        location = profile["location"] or None
+        await self.callback.on_progress(f"Got name: {name}", 20)
+
+        open_to_work = profile["openToWork"]
+        about = profile["about"].strip() if profile["about"] else None
+        await self.callback.on_progress("Got about section", 30)
+
+        experiences = self._get_main_page_experiences(profile["experiences"])
+        educations = self._get_main_page_educations(profile["educations"])
+        interests = await self._get_main_page_interests()
+
+        # Sections missing from the main page come from their details pages
+        missing = [
+            (name, getter)
+            for name, getter, found in (
+                ("experiences", PersonScraper._get_details_experiences, experiences),
+                ("educations", PersonScraper._get_details_educations, educations),
+                ("interests", PersonScraper._get_details_interests, interests),
             )
-
-            contacts = await self._get_contacts(linkedin_url)
-            await self.callback.on_progress(f"Got {len(contacts)} contacts", 95)
-
-            person = Person(
-                linkedin_url=linkedin_url,
-                name=name,
-                location=location,
-                about=about,
-                open_to_work=open_to_work,
-                experiences=experiences,
-                educations=educations,
-                interests=interests,
-                accomplishments=accomplishments,
-                contacts=contacts,
+            if not found
+        ]
+        if missing:
+            results = await self._run_sections(
+                [getter for _, getter in missing], base_url, slots
             )
+            details = dict(zip((name for name, _ in missing), results))
+            experiences = details.get("experiences", experiences)
+            educations = details.get("educations", educations)
+            interests = details.get("interests", interests)
+
+        await self.callback.on_progress(f"Got {len(experiences)} experiences", 50)
+        await self.callback.on_progress(f"Got {len(educations)} educations", 60)
+        await self.callback.on_progress(f"Got {len(interests)} interests", 65)
+
+        if detached is not None:
+            # A failed sibling page (e.g. new_page() erroring) leaves that
+            # section empty, like errors on this page do
+            contacts, accomplishments = await detached
+            if isinstance(contacts, BaseException):
+                logger.debug(f"Error getting contacts: {contacts}")
+                contacts = []
+            if isinstance(accomplishments, BaseException):
+                logger.debug(f"Error getting accomplishments: {accomplishments}")
+                accomplishments = []
+        else:
+            accomplishments = await self._get_accomplishments(base_url)
+            contacts = await self._get_contacts(base_url)
+        await self.callback.on_progress(
+            f"Got {len(accomplishments)} accomplishments", 85
+        )
+        await self.callback.on_progress(f"Got {len(contacts)} contacts", 95)
+
+        return Person(
+            linkedin_url=linkedin_url,
+            name=name,
+            location=location,
+            about=about,
+            open_to_work=open_to_work,
+            experiences=experiences,
+            educations=educations,
+            interests=interests,
+            accomplishments=accomplishments,
+            contacts=contacts,
+        )
+
+    async def _run_sections(
+        self,
+        sections: list[Callable[["PersonScraper", str], Awaitable[list]]],
+        base_url: str,
+        slots: Optional[asyncio.Semaphore] = None,
+    ) -> list[list]:
+        """
+        Run section getters that navigate, concurrently when possible.
 
-            await self.callback.on_progress("Scraping complete", 100)
-            await self.callback.on_complete("person", person)
+        Args:
+            sections: Unbound section getters
+            base_url: Normalized profile URL (with trailing slash)
+            slots: Semaphore bounding extra pages, or None to run the getters
+                one after another on this page
 
-            return person
+        Returns:
+            The getters' results, in order
+        """
+        if slots is None:
+            return [await section(self, base_url) for section in sections]
+        return await asyncio.gather(
+            *(self._scrape_on_new_page(section, base_url, slots) for section in sections)
+        )
+
+    async def _scrape_on_new_page(
+        self,
+        section: Callable[["PersonScraper", str], Awaitable[list]],
+        base_url: str,
+        slots: asyncio.Semaphore,
+    ) -> list:
+        """
+        Run a section getter on a fresh page of the same browser context.
 
-        except Exception as e:
-            await self.callback.on_error(e)
-            raise ScrapingError(f"Failed to scrape person profile: {e}")
+        Args:
+            section: Unbound section getter, e.g. ``PersonScraper._get_page_contacts``
+            base_url: Normalized profile URL (with trailing slash)
+            slots: Semaphore bounding the number of extra pages
+
+        Returns:
+            Whatever the section getter returns
+        """
+        async with slots:
+            page = await self.page.context.new_page()
+            try:
+                return await section(
+                    PersonScraper(
+                        page,
+                        max_concurrency=1,
+                        block_resources=False,
+                        selectors=self.selectors,
+                    ),
+                    base_url,
+                )
+            finally:
+                await page.close()
 
-    async def _get_name_and_location(self) -> tuple[str, Optional[str]]:
-        """Extract name and location from profile."""
+    async def _bulk_scroll(
+        self, interval: float = 0.2, stable_rounds: int = 2, max_rounds: int = 12
+    ) -> None:
+        """
+        Scroll to the bottom in one evaluate until the page height settles.
+
+        Args:
+            interval: Settle time between height checks in seconds
+            stable_rounds: Consecutive unchanged heights required
+            max_rounds: Maximum number of scrolls
+        """
         try:
-            name = await self.safe_extract_text("h1", default="Unknown")
-            location = await self.safe_extract_text(
-                ".text-body-small.inline.t-black--light.break-words", default=""
+            await self.page.evaluate(
+                _BULK_SCROLL_JS,
+                {
+                    "interval": int(interval * 1000),
+                    "stableRounds": stable_rounds,
+                    "maxRounds": max_rounds,
+                },
             )
-            return name, location if location else None
         except Exception as e:
-            logger.warning(f"Error getting name/location: {e}")
-            return "Unknown", None
+            logger.debug(f"Bulk scroll failed, scrolling step by step: {e}")
+            await self.scroll_page_to_bottom(pause_time=interval, max_scrolls=3)
 
-    async def _check_open_to_work(self) -> bool:
-        """Check if profile has open to work badge."""
+    async def _snapshot_profile(self) -> dict:
+        """Read the header fields, top card and main-page section items in one evaluate."""
         try:
-            # Look for open to work indicator
-            img_title = await self.get_attribute_safe(
-                ".pv-top-card-profile-picture img", "title", default=""
+            return await self.page.evaluate(
+                _PROFILE_JS,
+                {
+                    "fields": {field: self.selectors[field] for field in _PROFILE_FIELDS},
+                    "aboutLimit": self.about_limit,
+                },
             )
-            return "#OPEN_TO_WORK" in img_title.upper()
-        except:
-            return False
+        except Exception as e:
+            logger.warning(f"Error reading profile page: {e}")
+            return {
+                "name": "",
+                "title": "",
+                "location": "",
+                "openToWork": False,
+                "about": None,
+                "experiences": [],
+                "educations": [],
+            }
+
+    def _get_main_page_experiences(self, items: list[dict]) -> list[Experience]:
+        """Build experiences from main profile page Experience section item snapshots."""
+        experiences = []
 
-    async def _get_about(self) -> Optional[str]:
-        """Extract about section."""
-        try:
-            # Find the profile card that contains "About"
-            profile_cards = await self.page.locator(
-                '[data-view-name="profile-card"]'
-            ).all()
-
-            for card in profile_cards:
-                card_text = await card.inner_text()
-                # Check if this card contains "About" heading
-                if card_text.strip().startswith("About"):
-                    # Get the span with aria-hidden to avoid duplication
-                    about_spans = await card.locator('span[aria-hidden="true"]').all()
-                    # Skip the first span (it's the "About" heading), get the content
-                    if len(about_spans) > 1:
-                        about_text = await about_spans[1].text_content()
-                        return about_text.strip() if about_text else None
+        for data in items:
+            exp = self._parse_main_page_experience(data)
+            if exp:
+                experiences.append(exp)
 
-            return None
-        except Exception as e:
-            logger.debug(f"Error getting about section: {e}")
-            return None
+        return experiences
 
-    async def _get_experiences(self, base_url: str) -> list[Experience]:
-        """Extract experiences from the main profile page Experience section."""
+    async def _get_details_experiences(self, base_url: str) -> list[Experience]:
+        """Extract experiences from the details/experience page."""
         experiences = []
 
         try:
-            experience_heading = self.page.locator('h2:has-text("Experience")').first
-            
-            if await experience_heading.count() > 0:
-                experience_section = experience_heading.locator('xpath=ancestor::*[.//ul or .//ol][1]')
-                if await experience_section.count() == 0:
-                    experience_section = experience_heading.locator('xpath=ancestor::*[4]')
-                
-                if await experience_section.count() > 0:
-                    items = await experience_section.locator('ul > li, ol > li').all()
-                    
-                    for item in items:
-                        try:
-                            exp = await self._parse_main_page_experience(item)
-                            if exp:
-                                experiences.append(exp)
-                        except Exception as e:
-                            logger.debug(f"Error parsing experience from main page: {e}")
-                            continue
-            
-            if not experiences:
-                exp_url = urljoin(base_url, "details/experience")
-                await self.navigate_and_wait(exp_url)
-                await self.page.wait_for_selector("main", timeout=10000)
-                await self.wait_and_focus(1.5)
-                await self.scroll_page_to_half()
-                await self.scroll_page_to_bottom(pause_time=0.5, max_scrolls=5)
-
-                items = []
-                main_element = self.page.locator('main')
-                if await main_element.count() > 0:
-                    list_items = await main_element.locator('list > listitem, ul > li').all()
-                    if list_items:
-                        items = list_items
-                
-                if not items:
-                    old_list = self.page.locator(".pvs-list__container").first
-                    if await old_list.count() > 0:
-                        items = await old_list.locator(".pvs-list__paged-list-item").all()
+            exp_url = f"{base_url}details/experience/"
+            await self.navigate_and_wait(exp_url)
+            await self.page.wait_for_selector("main", timeout=10000)
+            await self.wait_for_list_stable(self.selectors["detail_list_items"])
 
-                for item in items:
-                    try:
-                        result = await self._parse_experience_item(item)
-                        if result:
-                            if isinstance(result, list):
-                                experiences.extend(result)
-                            else:
-                                experiences.append(result)
-                    except Exception as e:
-                        logger.debug(f"Error parsing experience item: {e}")
-                        continue
+            items = await self._snapshot_list_items('main list > listitem, main ul > li')
+
+            for item in items:
+                try:
+                    result = self._parse_experience_item(item)
+                    if result:
+                        if isinstance(result, list):
+                            experiences.extend(result)
+                        else:
+                            experiences.append(result)
+                except Exception as e:
+                    logger.debug(f"Error parsing experience item: {e}")
+                    continue
 
         except Exception as e:
             logger.warning(
@@ -219,173 +988,110 @@ class PersonScraper(BaseScraper):
 
         return experiences
     
-    async def _parse_main_page_experience(self, item) -> Optional[Experience]:
-        """Parse experience from main profile page list item with [logo_link, details_link] structure."""
+    def _parse_main_page_experience(self, data: dict) -> Optional[Experience]:
+        """Parse experience from a main profile page item snapshot with [logo_link, details_link] structure."""
         try:
-            links = await item.locator('a').all()
-            if len(links) < 2:
+            if data["linkCount"] < 2:
                 return None
             
-            company_url = await links[0].get_attribute('href')
-            detail_link = links[1]
-            
-            unique_texts = await self._extract_unique_texts_from_element(detail_link)
+            company_url = data["href"]
+            unique_texts = data["texts"]
             
             if len(unique_texts) < 2:
                 return None
             
-            position_title = unique_texts[0]
-            company_name = unique_texts[1]
             work_times = unique_texts[2] if len(unique_texts) > 2 else ""
             
-            from_date, to_date, duration = self._parse_work_times(work_times)
-            
-            return Experience(
-                position_title=position_title,
-                institution_name=company_name,
-                linkedin_url=company_url,
-                from_date=from_date,
-                to_date=to_date,
-                duration=duration,
-                location=None,
-                description=None,
+            return self._build_experience(
+                unique_texts[0], unique_texts[1], company_url, work_times
             )
             
         except Exception as e:
             logger.debug(f"Error parsing main page experience: {e}")
             return None
     
-    async def _extract_unique_texts_from_element(self, element) -> list[str]:
-        """Extract unique text content from nested elements, avoiding duplicates from parent/child overlap."""
-        text_elements = await element.locator('span[aria-hidden="true"], div > span').all()
-        
-        if not text_elements:
-            text_elements = await element.locator('span, div').all()
-        
-        seen_texts = set()
-        unique_texts = []
-        
-        for el in text_elements:
-            text = await el.text_content()
-            if text and text.strip():
-                text = text.strip()
-                if text not in seen_texts and len(text) < 200 and not any(text in t or t in text for t in seen_texts if len(t) > 3):
-                    seen_texts.add(text)
-                    unique_texts.append(text)
-        
-        return unique_texts
+    async def _snapshot_list_items(self, selector: str) -> list[dict]:
+        """
+        Snapshot details-page list items with a single evaluate_all.
+
+        Falls back to the older paged-list layout when ``selector`` matches
+        nothing.
+        """
+        items = await self.page.locator(selector).evaluate_all(_LIST_ITEMS_JS)
+        if not items:
+            old_list = self.page.locator(self.selectors["list_container"]).first.locator(
+                self.selectors["paged_list_item"]
+            )
+            items = await old_list.evaluate_all(_LIST_ITEMS_JS)
+        return items
 
-    async def _parse_experience_item(self, item):
-        """Parse experience item. Returns Experience or list for nested positions."""
+    def _parse_experience_item(self, item: dict):
+        """Parse an experience item snapshot. Returns Experience or list for nested positions."""
         try:
-            links = await item.locator('a, link').all()
-            if len(links) >= 2:
-                company_url = await links[0].get_attribute('href')
-                detail_link = links[1]
-                
-                generics = await detail_link.locator('generic, span, div').all()
-                texts = []
-                for g in generics:
-                    text = await g.text_content()
-                    if text and text.strip() and len(text.strip()) < 200:
-                        texts.append(text.strip())
-                
-                unique_texts = list(dict.fromkeys(texts))
+            if item["linkCount"] >= 2:
+                company_url = item["href"]
+                unique_texts = item["texts"]
                 
                 if len(unique_texts) >= 2:
-                    position_title = unique_texts[0]
-                    company_name = unique_texts[1]
-                    work_times = unique_texts[2] if len(unique_texts) > 2 else ""
-                    location = unique_texts[3] if len(unique_texts) > 3 else ""
+                    position_title, company_name, work_times, location = (unique_texts + [""] * 4)[:4]
                     
-                    from_date, to_date, duration = self._parse_work_times(work_times)
-                    
-                    return Experience(
-                        position_title=position_title,
-                        institution_name=company_name,
-                        linkedin_url=company_url,
-                        from_date=from_date,
-                        to_date=to_date,
-                        duration=duration,
-                        location=location,
-                        description=None,
+                    return self._build_experience(
+                        position_title, company_name, company_url, work_times, location
                     )
             
-            entity = item.locator('div[data-view-name="profile-component-entity"]').first
-            if await entity.count() == 0:
-                return None
-
-            children = await entity.locator("> *").all()
-            if len(children) < 2:
+            entity = item["entity"]
+            if not entity or not entity["header"]:
                 return None
 
-            company_link = children[0].locator("a").first
-            company_url = await company_link.get_attribute("href")
-
-            detail_container = children[1]
-            detail_children = await detail_container.locator("> *").all()
+            company_url = entity["url"]
+            header = entity["header"]
 
-            if len(detail_children) == 0:
-                return None
+            if entity["positions"] is not None:
+                # First span is company name for nested positions
+                return self._parse_nested_experience(
+                    company_url, header[0], entity["positions"]
+                )
 
-            has_nested_positions = False
-            if len(detail_children) > 1:
-                nested_list = await detail_children[1].locator(".pvs-list__container").count()
-                has_nested_positions = nested_list > 0
+            position_title, company_name, work_times, location = (header + [""] * 4)[:4]
 
-            if has_nested_positions:
-                return await self._parse_nested_experience(item, company_url, detail_children)
-            else:
-                first_detail = detail_children[0]
-                nested_elements = await first_detail.locator("> *").all()
-
-                if len(nested_elements) == 0:
-                    return None
-
-                span_container = nested_elements[0]
-                outer_spans = await span_container.locator("> *").all()
-
-                position_title = ""
-                company_name = ""
-                work_times = ""
-                location = ""
-
-                if len(outer_spans) >= 1:
-                    aria_span = outer_spans[0].locator('span[aria-hidden="true"]').first
-                    position_title = await aria_span.text_content()
-                if len(outer_spans) >= 2:
-                    aria_span = outer_spans[1].locator('span[aria-hidden="true"]').first
-                    company_name = await aria_span.text_content()
-                if len(outer_spans) >= 3:
-                    aria_span = outer_spans[2].locator('span[aria-hidden="true"]').first
-                    work_times = await aria_span.text_content()
-                if len(outer_spans) >= 4:
-                    aria_span = outer_spans[3].locator('span[aria-hidden="true"]').first
-                    location = await aria_span.text_content()
-
-                from_date, to_date, duration = self._parse_work_times(work_times)
-
-                description = ""
-                if len(detail_children) > 1:
-                    description = await detail_children[1].inner_text()
-
-                return Experience(
-                    position_title=position_title.strip(),
-                    institution_name=company_name.strip(),
-                    linkedin_url=company_url,
-                    from_date=from_date,
-                    to_date=to_date,
-                    duration=duration,
-                    location=location.strip(),
-                    description=description.strip() if description else None,
-                )
+            return self._build_experience(
+                position_title,
+                company_name,
+                company_url,
+                work_times,
+                location,
+                entity["description"],
+            )
 
         except Exception as e:
             logger.debug(f"Error parsing experience: {e}")
             return None
 
-    async def _parse_nested_experience(
-        self, item, company_url: str, detail_children
+    def _build_experience(
+        self,
+        position_title: str,
+        company_name: str,
+        company_url: Optional[str],
+        work_times: str = "",
+        location: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Experience:
+        """Build an Experience from raw header texts, parsing its work times."""
+        from_date, to_date, duration = self._parse_work_times(work_times)
+
+        return Experience(
+            position_title=position_title.strip(),
+            institution_name=company_name.strip(),
+            linkedin_url=company_url,
+            from_date=from_date,
+            to_date=to_date,
+            duration=duration,
+            location=location.strip() if location else None,
+            description=description.strip() if description else None,
+        )
+
+    def _parse_nested_experience(
+        self, company_url: Optional[str], company_name: str, positions: list[dict]
     ) -> list[Experience]:
         """
         Parse nested experience positions (multiple roles at the same company).
@@ -393,94 +1099,26 @@ class PersonScraper(BaseScraper):
         """
         experiences = []
 
-        try:
-            # Get company name from first detail
-            first_detail = detail_children[0]
-            nested_elements = await first_detail.locator("> *").all()
-            if len(nested_elements) == 0:
-                return []
-
-            span_container = nested_elements[0]
-            outer_spans = await span_container.locator("> *").all()
-
-            # First span is company name for nested positions
-            company_name = ""
-            if len(outer_spans) >= 1:
-                aria_span = outer_spans[0].locator('span[aria-hidden="true"]').first
-                company_name = await aria_span.text_content()
-
-            # Get the nested list from detail_children[1]
-            nested_container = detail_children[1].locator(".pvs-list__container").first
-            nested_items = await nested_container.locator(
-                ".pvs-list__paged-list-item"
-            ).all()
-
-            for nested_item in nested_items:
-                try:
-                    # Each nested item has a link with position details
-                    link = nested_item.locator("a").first
-                    link_children = await link.locator("> *").all()
-
-                    if len(link_children) == 0:
-                        continue
-
-                    # Navigate to get the spans
-                    first_child = link_children[0]
-                    nested_els = await first_child.locator("> *").all()
-                    if len(nested_els) == 0:
-                        continue
-
-                    spans_container = nested_els[0]
-                    position_spans = await spans_container.locator("> *").all()
-
-                    # Extract position details
-                    position_title = ""
-                    work_times = ""
-                    location = ""
-
-                    if len(position_spans) >= 1:
-                        aria_span = (
-                            position_spans[0].locator('span[aria-hidden="true"]').first
-                        )
-                        position_title = await aria_span.text_content()
-                    if len(position_spans) >= 2:
-                        aria_span = (
-                            position_spans[1].locator('span[aria-hidden="true"]').first
-                        )
-                        work_times = await aria_span.text_content()
-                    if len(position_spans) >= 3:
-                        aria_span = (
-                            position_spans[2].locator('span[aria-hidden="true"]').first
-                        )
-                        location = await aria_span.text_content()
-
-                    # Parse dates
-                    from_date, to_date, duration = self._parse_work_times(work_times)
-
-                    # Get description if available
-                    description = ""
-                    if len(link_children) > 1:
-                        description = await link_children[1].inner_text()
-
-                    experiences.append(
-                        Experience(
-                            position_title=position_title.strip(),
-                            institution_name=company_name.strip(),
-                            linkedin_url=company_url,
-                            from_date=from_date,
-                            to_date=to_date,
-                            duration=duration,
-                            location=location.strip(),
-                            description=description.strip() if description else None,
-                        )
-                    )
-
-                except Exception as e:
-                    logger.debug(f"Error parsing nested position: {e}")
+        for position in positions:
+            try:
+                if not position["header"]:
                     continue
+                position_title, work_times, location = (position["header"] + [""] * 3)[:3]
+
+                experiences.append(
+                    self._build_experience(
+                        position_title,
+                        company_name,
+                        company_url,
+                        work_times,
+                        location,
+                        position["description"],
+                    )
+                )
 
-        except Exception as e:
-            logger.debug(f"Error parsing nested experience: {e}")
+            except Exception as e:
+                logger.debug(f"Error parsing nested position: {e}")
+                continue
 
         return experiences
 
@@ -494,82 +1132,43 @@ class PersonScraper(BaseScraper):
         - "2000 - Present · 26 yrs 1 mo" -> ("2000", "Present", "26 yrs 1 mo")
         - "Jan 2020 - Dec 2022 · 2 yrs" -> ("Jan 2020", "Dec 2022", "2 yrs")
         - "2015 - Present" -> ("2015", "Present", None)
+        - "5 yrs 2 mos" -> (None, None, "5 yrs 2 mos")
         """
         if not work_times:
             return None, None, None
+        return _split_work_times(work_times)
 
-        try:
-            # Split by · to separate date range from duration
-            parts = work_times.split("·")
-            times = parts[0].strip() if len(parts) > 0 else ""
-            duration = parts[1].strip() if len(parts) > 1 else None
-
-            # Parse dates - split by " - " to get from and to
-            if " - " in times:
-                date_parts = times.split(" - ")
-                from_date = date_parts[0].strip()
-                to_date = date_parts[1].strip() if len(date_parts) > 1 else ""
-            else:
-                from_date = times
-                to_date = ""
+    def _get_main_page_educations(self, items: list[dict]) -> list[Education]:
+        """Build educations from main profile page Education section item snapshots."""
+        educations = []
 
-            return from_date, to_date, duration
-        except Exception as e:
-            logger.debug(f"Error parsing work times '{work_times}': {e}")
-            return None, None, None
+        for data in items:
+            edu = self._parse_main_page_education(data)
+            if edu:
+                educations.append(edu)
+
+        return educations
 
-    async def _get_educations(self, base_url: str) -> list[Education]:
-        """Extract educations from the main profile page Education section."""
+    async def _get_details_educations(self, base_url: str) -> list[Education]:
+        """Extract educations from the details/education page."""
         educations = []
 
         try:
-            education_heading = self.page.locator('h2:has-text("Education")').first
-            
-            if await education_heading.count() > 0:
-                education_section = education_heading.locator('xpath=ancestor::*[.//ul or .//ol][1]')
-                if await education_section.count() == 0:
-                    education_section = education_heading.locator('xpath=ancestor::*[4]')
-                
-                if await education_section.count() > 0:
-                    items = await education_section.locator('ul > li, ol > li').all()
-                    
-                    for item in items:
-                        try:
-                            edu = await self._parse_main_page_education(item)
-                            if edu:
-                                educations.append(edu)
-                        except Exception as e:
-                            logger.debug(f"Error parsing education from main page: {e}")
-                            continue
-            
-            if not educations:
-                edu_url = urljoin(base_url, "details/education")
-                await self.navigate_and_wait(edu_url)
-                await self.page.wait_for_selector("main", timeout=10000)
-                await self.wait_and_focus(2)
-                await self.scroll_page_to_half()
-                await self.scroll_page_to_bottom(pause_time=0.5, max_scrolls=5)
-
-                items = []
-                main_element = self.page.locator('main')
-                if await main_element.count() > 0:
-                    list_items = await main_element.locator('ul > li, ol > li').all()
-                    if list_items:
-                        items = list_items
-                
-                if not items:
-                    old_list = self.page.locator(".pvs-list__container").first
-                    if await old_list.count() > 0:
-                        items = await old_list.locator(".pvs-list__paged-list-item").all()
+            edu_url = f"{base_url}details/education/"
+            await self.navigate_and_wait(edu_url)
+            await self.page.wait_for_selector("main", timeout=10000)
+            await self.wait_for_list_stable(self.selectors["detail_list_items"])
 
-                for item in items:
-                    try:
-                        edu = await self._parse_education_item(item)
-                        if edu:
-                            educations.append(edu)
-                    except Exception as e:
-                        logger.debug(f"Error parsing education item: {e}")
-                        continue
+            items = await self._snapshot_list_items('main ul > li, main ol > li')
+
+            for item in items:
+                try:
+                    edu = self._parse_education_item(item)
+                    if edu:
+                        educations.append(edu)
+                except Exception as e:
+                    logger.debug(f"Error parsing education item: {e}")
+                    continue
 
         except Exception as e:
             logger.warning(
@@ -578,141 +1177,77 @@ class PersonScraper(BaseScraper):
 
         return educations
     
-    async def _parse_main_page_education(self, item) -> Optional[Education]:
-        """Parse education from main profile page list item with [logo_link, details_link] structure."""
+    def _parse_main_page_education(self, data: dict) -> Optional[Education]:
+        """Parse education from a main profile page item snapshot with [logo_link, details_link] structure."""
         try:
-            links = await item.locator('a').all()
-            if not links:
+            if not data["linkCount"]:
                 return None
-            
-            institution_url = await links[0].get_attribute('href')
-            detail_link = links[1] if len(links) > 1 else links[0]
-            
-            unique_texts = await self._extract_unique_texts_from_element(detail_link)
-            
-            if not unique_texts:
-                return None
-            
-            institution_name = unique_texts[0]
-            degree = None
-            times = ""
-            
-            if len(unique_texts) == 3:
-                degree = unique_texts[1]
-                times = unique_texts[2]
-            elif len(unique_texts) == 2:
-                second = unique_texts[1]
-                if " - " in second or any(c.isdigit() for c in second):
-                    times = second
-                else:
-                    degree = second
-            
-            from_date, to_date = self._parse_education_times(times)
-            
-            return Education(
-                institution_name=institution_name,
-                degree=degree.strip() if degree else None,
-                linkedin_url=institution_url,
-                from_date=from_date,
-                to_date=to_date,
-                description=None,
-            )
-            
+            return self._education_from_texts(data["href"], data["texts"])
         except Exception as e:
             logger.debug(f"Error parsing main page education: {e}")
             return None
 
-    async def _parse_education_item(self, item) -> Optional[Education]:
-        """Parse a single education item."""
+    def _education_from_texts(
+        self, institution_url: Optional[str], unique_texts: list[str]
+    ) -> Optional[Education]:
+        """
+        Build an Education from a link item's unique texts.
+
+        The texts are [institution, degree, times]; with only two, the second
+        is the times when it has digits and the degree otherwise.
+        """
+        if not unique_texts:
+            return None
+        
+        institution_name = unique_texts[0]
+        degree = None
+        times = ""
+        
+        if len(unique_texts) == 3:
+            degree = unique_texts[1]
+            times = unique_texts[2]
+        elif len(unique_texts) == 2:
+            second = unique_texts[1]
+            if " - " in second or any(c.isdigit() for c in second):
+                times = second
+            else:
+                degree = second
+        
+        from_date, to_date = self._parse_education_times(times)
+        
+        return Education(
+            institution_name=institution_name,
+            degree=degree.strip() if degree else None,
+            linkedin_url=institution_url,
+            from_date=from_date,
+            to_date=to_date,
+            description=None,
+        )
+
+    def _parse_education_item(self, item: dict) -> Optional[Education]:
+        """Parse a single education item snapshot."""
         try:
-            links = await item.locator('a, link').all()
-            if len(links) >= 1:
-                institution_url = await links[0].get_attribute('href')
-                
-                detail_link = links[1] if len(links) >= 2 else links[0]
-                generics = await detail_link.locator('generic, span, div').all()
-                texts = []
-                for g in generics:
-                    text = await g.text_content()
-                    if text and text.strip() and len(text.strip()) < 200:
-                        texts.append(text.strip())
-                
-                unique_texts = list(dict.fromkeys(texts))
-                
-                if unique_texts:
-                    institution_name = unique_texts[0]
-                    degree = None
-                    times = ""
-                    
-                    if len(unique_texts) == 3:
-                        degree = unique_texts[1]
-                        times = unique_texts[2]
-                    elif len(unique_texts) == 2:
-                        second = unique_texts[1]
-                        if " - " in second or second.isdigit() or any(c.isdigit() for c in second):
-                            times = second
-                        else:
-                            degree = second
-                    
-                    from_date, to_date = self._parse_education_times(times)
-                    
-                    return Education(
-                        institution_name=institution_name,
-                        degree=degree.strip() if degree else None,
-                        linkedin_url=institution_url,
-                        from_date=from_date,
-                        to_date=to_date,
-                        description=None,
-                    )
+            if item["linkCount"] >= 1 and item["texts"]:
+                return self._education_from_texts(item["href"], item["texts"])
             
-            entity = item.locator('div[data-view-name="profile-component-entity"]').first
-            if await entity.count() == 0:
-                return None
-
-            children = await entity.locator("> *").all()
-            if len(children) < 2:
-                return None
-
-            institution_link = children[0].locator("a").first
-            institution_url = await institution_link.get_attribute("href")
-
-            detail_container = children[1]
-            detail_children = await detail_container.locator("> *").all()
-
-            if len(detail_children) == 0:
+            entity = item["entity"]
+            if not entity or not entity["header"]:
                 return None
 
-            first_detail = detail_children[0]
-            nested_elements = await first_detail.locator("> *").all()
-
-            if len(nested_elements) == 0:
-                return None
-
-            span_container = nested_elements[0]
-            outer_spans = await span_container.locator("> *").all()
-
-            institution_name = ""
+            institution_url = entity["url"]
+            header = entity["header"]
+            institution_name = header[0]
             degree = None
             times = ""
 
-            if len(outer_spans) >= 1:
-                aria_span = outer_spans[0].locator('span[aria-hidden="true"]').first
-                institution_name = await aria_span.text_content()
-
-            if len(outer_spans) == 3:
-                aria_span = outer_spans[1].locator('span[aria-hidden="true"]').first
-                degree = await aria_span.text_content()
-                aria_span = outer_spans[2].locator('span[aria-hidden="true"]').first
-                times = await aria_span.text_content()
-            elif len(outer_spans) == 2:
-                aria_span = outer_spans[1].locator('span[aria-hidden="true"]').first
-                times = await aria_span.text_content()
+            if len(header) == 3:
+                degree = header[1]
+                times = header[2]
+            elif len(header) == 2:
+                times = header[1]
 
             from_date, to_date = self._parse_education_times(times)
-
-            description = ""
-            if len(detail_children) > 1:
-                description = await detail_children[1].inner_text()
+            description = entity["description"]
 
             return Education(
                 institution_name=institution_name.strip(),
@@ -733,124 +1268,105 @@ class PersonScraper(BaseScraper):
 
         Examples:
         - "1973 - 1977" -> ("1973", "1977")
+        - "2010 – 2014" -> ("2010", "2014")
         - "2015" -> ("2015", "2015")
         - "" -> (None, None)
         """
         if not times:
             return None, None
+        return _split_education_times(times)
+
+    async def _get_main_page_interests(self) -> list[Interest]:
+        """Extract interests from the main profile page Interests section with tablist (no navigation)."""
+        interests = []
 
         try:
-            # Split by " - " to get from and to dates
-            if " - " in times:
-                parts = times.split(" - ")
-                from_date = parts[0].strip()
-                to_date = parts[1].strip() if len(parts) > 1 else ""
-            else:
-                # Single year
-                from_date = times.strip()
-                to_date = times.strip()
+            # A missing heading or tablist just yields no tabs, so there is no
+            # need to probe for them first
+            interests_heading = self.page.locator('main h2:has-text("Interests")').first
+            interests_section = interests_heading.locator(
+                'xpath=ancestor::*[.//tab or .//*[@role="tab"]][1]'
+            )
+            interests = await self._read_interest_tabs(interests_section, 0.5)
 
-            return from_date, to_date
         except Exception as e:
-            logger.debug(f"Error parsing education times '{times}': {e}")
-            return None, None
+            logger.warning(f"Error getting interests: {e}")
 
-    async def _get_interests(self, base_url: str) -> list[Interest]:
-        """Extract interests from the main profile page Interests section with tablist."""
+        return interests
+
+    async def _get_details_interests(self, base_url: str) -> list[Interest]:
+        """Extract interests from the details/interests page tabs."""
         interests = []
 
         try:
-            interests_heading = self.page.locator('h2:has-text("Interests")').first
-            
-            if await interests_heading.count() > 0:
-                interests_section = interests_heading.locator('xpath=ancestor::*[.//tablist or .//*[@role="tablist"]][1]')
-                if await interests_section.count() == 0:
-                    interests_section = interests_heading.locator('xpath=ancestor::*[4]')
-                
-                tabs = await interests_section.locator('[role="tab"], tab').all() if await interests_section.count() > 0 else []
-                
-                if tabs:
-                    for tab in tabs:
-                        try:
-                            tab_name = await tab.text_content()
-                            if not tab_name:
-                                continue
-                            tab_name = tab_name.strip()
-                            category = self._map_interest_tab_to_category(tab_name)
-
-                            await tab.click()
-                            await self.wait_and_focus(0.5)
-
-                            tabpanel = interests_section.locator('[role="tabpanel"]').first
-                            if await tabpanel.count() > 0:
-                                list_items = await tabpanel.locator('li, listitem').all()
-                                
-                                for item in list_items:
-                                    try:
-                                        interest = await self._parse_interest_item(item, category)
-                                        if interest:
-                                            interests.append(interest)
-                                    except Exception as e:
-                                        logger.debug(f"Error parsing interest item: {e}")
-                                        continue
-                        except Exception as e:
-                            logger.debug(f"Error processing interest tab: {e}")
-                            continue
-            
-            if not interests:
-                interests_url = urljoin(base_url, "details/interests/")
-                await self.navigate_and_wait(interests_url)
-                await self.page.wait_for_selector("main", timeout=10000)
-                await self.wait_and_focus(1.5)
-
-                tabs = await self.page.locator('[role="tab"], tab').all()
-
-                if not tabs:
-                    logger.debug("No interests tabs found on profile")
-                    return interests
-
-                for tab in tabs:
-                    try:
-                        tab_name = await tab.text_content()
-                        if not tab_name:
-                            continue
-                        tab_name = tab_name.strip()
-                        category = self._map_interest_tab_to_category(tab_name)
-
-                        await tab.click()
-                        await self.wait_and_focus(0.8)
-
-                        tabpanel = self.page.locator('[role="tabpanel"], tabpanel').first
-                        list_items = await tabpanel.locator("listitem, li, .pvs-list__paged-list-item").all()
-
-                        for item in list_items:
-                            try:
-                                interest = await self._parse_interest_item(item, category)
-                                if interest:
-                                    interests.append(interest)
-                            except Exception as e:
-                                logger.debug(f"Error parsing interest item: {e}")
-                                continue
-
-                    except Exception as e:
-                        logger.debug(f"Error processing interest tab: {e}")
-                        continue
+            interests_url = f"{base_url}details/interests/"
+            await self.navigate_and_wait(interests_url)
+            try:
+                await self.page.wait_for_selector(
+                    self.selectors["tab"], timeout=10000, state="attached"
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("No interests tabs found on profile")
+                return interests
+
+            interests = await self._read_interest_tabs(self.page, 0.8)
 
         except Exception as e:
             logger.warning(f"Error getting interests: {e}")
 
         return interests
+
+    async def _read_interest_tabs(
+        self, scope: Union["Page", "Locator"], settle: float
+    ) -> list[Interest]:
+        """
+        Read the interests of every tab under scope.
+
+        Panels already in the DOM are read in one evaluate; only tabs whose
+        panel is missing or empty are clicked and read after they open.
+
+        Args:
+            scope: Page or element containing the tablist and its panels
+            settle: Seconds to wait after clicking a tab
+
+        Returns:
+            List of interests
+        """
+        interests = []
+        tab_locator = scope.locator(self.selectors["tab"])
+        item_selector = self.selectors["interest_items"]
+        tabs = await tab_locator.evaluate_all(_INTEREST_PANELS_JS, item_selector)
+
+        for index, tab in enumerate(tabs):
+            if not tab["name"]:
+                continue
+            try:
+                category = self._map_interest_tab_to_category(tab["name"])
+
+                items = tab["items"]
+                if not items:
+                    await tab_locator.nth(index).click()
+                    await self.wait_and_focus(settle)
+
+                    tabpanel = scope.locator(self.selectors["tabpanel"]).locator("visible=true").first
+                    items = await tabpanel.locator(item_selector).evaluate_all(_INTEREST_LIST_JS)
+
+                for item in items:
+                    interest = self._parse_interest_item(item, category)
+                    if interest:
+                        interests.append(interest)
+
+            except Exception as e:
+                logger.debug(f"Error processing interest tab: {e}")
+                continue
+
+        return interests
     
-    async def _parse_interest_item(self, item, category: str) -> Optional[Interest]:
-        """Parse a single interest item from profile or details page."""
+    def _parse_interest_item(self, item: dict, category: str) -> Optional[Interest]:
+        """Parse a single interest item snapshot from profile or details page."""
         try:
-            link = item.locator("a, link").first
-            if await link.count() == 0:
-                return None
-            href = await link.get_attribute("href")
-
-            unique_texts = await self._extract_unique_texts_from_element(item)
-            name = unique_texts[0] if unique_texts else None
+            href = item["href"]
+            name = item["texts"][0] if item["texts"] else None
 
             if name and href:
                 return Interest(
@@ -865,94 +1381,91 @@ class PersonScraper(BaseScraper):
 
     def _map_interest_tab_to_category(self, tab_name: str) -> str:
         tab_lower = tab_name.lower()
-        if "compan" in tab_lower:
-            return "company"
-        elif "group" in tab_lower:
-            return "group"
-        elif "school" in tab_lower:
-            return "school"
-        elif "newsletter" in tab_lower:
-            return "newsletter"
-        elif "voice" in tab_lower or "influencer" in tab_lower:
-            return "influencer"
-        else:
-            return tab_lower
+        match = _INTEREST_TAB_RE.search(tab_lower)
+        return match.lastgroup if match else tab_lower
 
-    async def _get_accomplishments(self, base_url: str) -> list[Accomplishment]:
-        accomplishments = []
+    async def _get_accomplishments(
+        self, base_url: str, slots: Optional[asyncio.Semaphore] = None
+    ) -> list[Accomplishment]:
+        """
+        Extract accomplishments from their details pages, one page per category.
 
-        accomplishment_sections = [
-            ("certifications", "certification"),
-            ("honors", "honor"),
-            ("publications", "publication"),
-            ("patents", "patent"),
-            ("courses", "course"),
-            ("projects", "project"),
-            ("languages", "language"),
-            ("organizations", "organization"),
+        Args:
+            base_url: Normalized profile URL (with trailing slash)
+            slots: Semaphore bounding extra pages, or None to visit the
+                sections one after another on this page
+        """
+        sections = [
+            functools.partial(
+                PersonScraper._get_accomplishment_section,
+                url_path=url_path,
+                category=category,
+            )
+            for url_path, category in _ACCOMPLISHMENT_SECTIONS
         ]
+        results = await self._run_sections(sections, base_url, slots)
+        return [accomplishment for result in results for accomplishment in result]
+
+    async def _get_accomplishment_section(
+        self, base_url: str, url_path: str, category: str
+    ) -> list[Accomplishment]:
+        """Extract one accomplishment category from its details page."""
+        accomplishments = []
+
+        try:
+            section_url = f"{base_url}details/{url_path}/"
+            await self.navigate_and_wait(section_url)
 
-        for url_path, category in accomplishment_sections:
+            # Either the list or the empty state shows up; wait for whichever
+            # renders first instead of a fixed delay
+            main_list = self.page.locator(self.selectors["accomplishment_list"]).first
+            nothing_to_see = self.page.locator(self.selectors["nothing_to_see"])
             try:
-                section_url = urljoin(base_url, f"details/{url_path}/")
-                await self.navigate_and_wait(section_url)
-                await self.page.wait_for_selector("main", timeout=10000)
-                await self.wait_and_focus(1)
-
-                nothing_to_see = await self.page.locator(
-                    'text="Nothing to see for now"'
-                ).count()
-                if nothing_to_see > 0:
-                    continue
+                await main_list.or_(nothing_to_see).first.wait_for(
+                    state="attached", timeout=10000
+                )
+            except PlaywrightTimeoutError:
+                return accomplishments
 
-                main_list = self.page.locator(
-                    ".pvs-list__container, main ul, main ol"
-                ).first
-                if await main_list.count() == 0:
-                    continue
+            if await nothing_to_see.count() > 0:
+                return accomplishments
 
-                items = await main_list.locator(".pvs-list__paged-list-item").all()
-                if not items:
-                    items = await main_list.locator("> li").all()
+            items = await main_list.locator(self.selectors["accomplishment_items"]).evaluate_all(
+                _ACCOMPLISHMENT_ITEMS_JS
+            )
 
-                seen_titles = set()
-                for item in items:
-                    try:
-                        accomplishment = await self._parse_accomplishment_item(
-                            item, category
-                        )
-                        if accomplishment and accomplishment.title not in seen_titles:
-                            seen_titles.add(accomplishment.title)
-                            accomplishments.append(accomplishment)
-                    except Exception as e:
-                        logger.debug(f"Error parsing {category} item: {e}")
-                        continue
+            # Same title issued again (e.g. a renewed certification) is a
+            # separate entry; the same card rendered twice is not
+            seen = set()
+            for item in items:
+                accomplishment = self._parse_accomplishment_item(item, category)
+                if not accomplishment:
+                    continue
+                key = (
+                    accomplishment.title.strip().lower(),
+                    accomplishment.issuer or "",
+                    accomplishment.issued_date or "",
+                )
+                if key not in seen:
+                    seen.add(key)
+                    accomplishments.append(accomplishment)
 
-            except Exception as e:
-                logger.debug(f"Error getting {category}s: {e}")
-                continue
+        except Exception as e:
+            logger.debug(f"Error getting {category}s: {e}")
 
         return accomplishments
 
-    async def _parse_accomplishment_item(
-        self, item, category: str
+    def _parse_accomplishment_item(
+        self, item: dict, category: str
     ) -> Optional[Accomplishment]:
+        """Parse a single accomplishment item snapshot from a details page."""
         try:
-            entity = item.locator(
-                'div[data-view-name="profile-component-entity"]'
-            ).first
-            if await entity.count() > 0:
-                spans = await entity.locator('span[aria-hidden="true"]').all()
-            else:
-                spans = await item.locator('span[aria-hidden="true"]').all()
-
             title = ""
             issuer = ""
             issued_date = ""
             credential_id = ""
 
-            for i, span in enumerate(spans[:5]):
-                text = await span.text_content()
+            for i, text in enumerate(item["spans"]):
                 if not text:
                     continue
                 text = text.strip()
@@ -960,49 +1473,25 @@ class PersonScraper(BaseScraper):
                 if len(text) > 500:
                     continue
 
+                match = _ACCOMPLISHMENT_LINE_RE.search(text) if i else None
+                kind = match.lastgroup if match else None
+
                 if i == 0:
                     title = text
-                elif "Issued by" in text:
-                    parts = text.split("·")
-                    issuer = parts[0].replace("Issued by", "").strip()
-                    if len(parts) > 1:
-                        issued_date = parts[1].strip()
-                elif "Issued " in text and not issued_date:
-                    issued_date = text.replace("Issued ", "")
-                elif "Credential ID" in text:
-                    credential_id = text.replace("Credential ID ", "")
+                elif kind == "issued_by":
+                    issuer = match["issuer"].strip()
+                    if match["date"] is not None:
+                        issued_date = match["date"].strip()
+                elif kind == "issued" and not issued_date:
+                    issued_date = match["issued_date"]
+                elif kind == "credential":
+                    credential_id = match["credential_id"]
                 elif i == 1 and not issuer:
                     issuer = text
-                elif (
-                    any(
-                        month in text
-                        for month in [
-                            "Jan",
-                            "Feb",
-                            "Mar",
-                            "Apr",
-                            "May",
-                            "Jun",
-                            "Jul",
-                            "Aug",
-                            "Sep",
-                            "Oct",
-                            "Nov",
-                            "Dec",
-                        ]
-                    )
-                    and not issued_date
-                ):
-                    if "·" in text:
-                        parts = text.split("·")
-                        issued_date = parts[0].strip()
-                    else:
-                        issued_date = text
-
-            link = item.locator('a[href*="credential"], a[href*="verify"]').first
-            credential_url = (
-                await link.get_attribute("href") if await link.count() > 0 else None
-            )
+                elif _MONTH_RE.search(text) and not issued_date:
+                    issued_date = text.partition("·")[0].strip()
+
+            credential_url = item["credentialUrl"]
 
             if not title or len(title) > 200:
                 return None
@@ -1020,50 +1509,119 @@ class PersonScraper(BaseScraper):
             logger.debug(f"Error parsing accomplishment: {e}")
             return None
 
-    async def _get_contacts(self, base_url: str) -> list[Contact]:
+    async def _get_contacts(
+        self, base_url: str, slots: Optional[asyncio.Semaphore] = None
+    ) -> list[Contact]:
+        """
+        Get contact info from the Voyager API, or from the contact-info dialog.
+
+        Args:
+            base_url: Normalized profile URL (with trailing slash)
+            slots: Semaphore bounding extra pages to load the dialog on a
+                sibling page, or None to load it on this page
+
+        Returns:
+            List of contacts
+        """
+        if self.use_voyager_api:
+            public_id = urlsplit(base_url).path.rstrip("/").rpartition("/")[2]
+            data = await self._voyager_get(
+                f"identity/profiles/{public_id}/profileContactInfo"
+            )
+            if data is not None:
+                try:
+                    return _contacts_from_api(data, base_url)
+                except Exception as e:
+                    logger.debug(f"Unexpected contact info response: {e}")
+
+        if slots is None:
+            return await self._get_page_contacts(base_url)
+        return await self._scrape_on_new_page(
+            PersonScraper._get_page_contacts, base_url, slots
+        )
+
+    async def _voyager_get(self, path: str) -> Optional[dict]:
+        """
+        GET a Voyager API path with the browser context's session cookies.
+
+        Args:
+            path: Path below /voyager/api/
+
+        Returns:
+            Decoded JSON response, or None if there is no session or the call
+            fails (e.g. 403 when LinkedIn rejects it)
+        """
+        try:
+            context = self.page.context
+            cookies = await context.cookies("https://www.linkedin.com")
+            csrf_token = next(
+                (c["value"].strip('"') for c in cookies if c["name"] == "JSESSIONID"),
+                None,
+            )
+            if not csrf_token:
+                return None
+
+            response = await context.request.get(
+                f"{_VOYAGER_API_URL}{path}",
+                headers={
+                    "csrf-token": csrf_token,
+                    "x-restli-protocol-version": "2.0.0",
+                    "accept": "application/json",
+                },
+            )
+            if not response.ok:
+                logger.debug(f"Voyager API returned {response.status} for {path}")
+                return None
+            return await response.json()
+        except Exception as e:
+            logger.debug(f"Voyager API request failed for {path}: {e}")
+            return None
+
+    async def _get_page_contacts(self, base_url: str) -> list[Contact]:
         """Extract contact info from the contact-info overlay dialog."""
         contacts = []
 
         try:
-            contact_url = urljoin(base_url, "overlay/contact-info/")
+            contact_url = f"{base_url}overlay/contact-info/"
             await self.navigate_and_wait(contact_url)
-            await self.wait_and_focus(1)
 
-            dialog = self.page.locator('dialog, [role="dialog"]').first
-            if await dialog.count() == 0:
+            try:
+                await self.page.wait_for_selector(
+                    self.selectors["dialog"], timeout=5000, state="attached"
+                )
+            except PlaywrightTimeoutError:
                 logger.warning("Contact info dialog not found")
                 return contacts
-
-            contact_sections = await dialog.locator('h3').all()
+            dialog = self.page.locator(self.selectors["dialog"]).first
+            sections = await dialog.evaluate(_CONTACT_SECTIONS_JS)
             
-            for section_heading in contact_sections:
+            for section in sections:
                 try:
-                    heading_text = await section_heading.text_content()
+                    heading_text = section["heading"].strip().lower()
                     if not heading_text:
                         continue
-                    heading_text = heading_text.strip().lower()
-                    
-                    section_container = section_heading.locator('xpath=ancestor::*[1]')
-                    if await section_container.count() == 0:
-                        continue
                     
                     contact_type = self._map_contact_heading_to_type(heading_text)
                     if not contact_type:
                         continue
                     
-                    links = await section_container.locator('a').all()
+                    links = section["links"]
+                    
+                    # The "(Work)"-style label belongs to the section, not to
+                    # each link, so look it up once
+                    label = None
+                    if links:
+                        for sib_text in section["texts"]:
+                            match = _CONTACT_LABEL_RE.fullmatch(sib_text.strip())
+                            if match:
+                                label = match.group(1)
+                                break
+                    
                     for link in links:
-                        href = await link.get_attribute('href')
-                        text = await link.text_content()
+                        href = link["href"]
+                        text = link["text"]
                         if href and text:
                             text = text.strip()
-                            label = None
-                            sibling_text = await section_container.locator('span, generic').all()
-                            for sib in sibling_text:
-                                sib_text = await sib.text_content()
-                                if sib_text and sib_text.strip().startswith('(') and sib_text.strip().endswith(')'):
-                                    label = sib_text.strip()[1:-1]
-                                    break
                             
                             if contact_type == "linkedin":
                                 contacts.append(Contact(type=contact_type, value=href, label=label))
@@ -1072,26 +1630,16 @@ class PersonScraper(BaseScraper):
                             else:
                                 contacts.append(Contact(type=contact_type, value=text, label=label))
                     
-                    if contact_type == "birthday" and not links:
-                        birthday_text = await section_container.text_content()
-                        if birthday_text:
-                            birthday_value = birthday_text.replace(heading_text, "").replace("Birthday", "").strip()
-                            if birthday_value:
-                                contacts.append(Contact(type="birthday", value=birthday_value))
-                    
-                    if contact_type == "phone" and not links:
-                        phone_text = await section_container.text_content()
-                        if phone_text:
-                            phone_value = phone_text.replace(heading_text, "").replace("Phone", "").strip()
-                            if phone_value:
-                                contacts.append(Contact(type="phone", value=phone_value))
-                    
-                    if contact_type == "address" and not links:
-                        address_text = await section_container.text_content()
-                        if address_text:
-                            address_value = address_text.replace(heading_text, "").replace("Address", "").strip()
-                            if address_value:
-                                contacts.append(Contact(type="address", value=address_value))
+                    # Birthday, phone and address may be plain text without links
+                    if contact_type in ("birthday", "phone", "address") and not links:
+                        value = (
+                            section["text"]
+                            .replace(heading_text, "")
+                            .replace(contact_type.capitalize(), "")
+                            .strip()
+                        )
+                        if value:
+                            contacts.append(Contact(type=contact_type, value=value))
                                 
                 except Exception as e:
                     logger.debug(f"Error parsing contact section: {e}")
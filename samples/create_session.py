@@ -36,7 +36,7 @@ async def create_session():
     async with BrowserManager(headless=False) as browser:
         # Navigate to LinkedIn login page
         print("Opening LinkedIn login page...")
-        await browser.page.goto("https://www.linkedin.com/login")
+        await browser.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded")
         
         print("\n🔐 Please log in to LinkedIn in the browser window...")
         print("   (You have 5 minutes to complete the login)")
@@ -1,39 +1,76 @@
 #!/usr/bin/env python3
 """
-Example: Scrape a single LinkedIn profile
+Example: Scrape LinkedIn profiles
 
-This example shows how to use the PersonScraper to scrape a LinkedIn profile.
+This example shows how to use the PersonScraper to scrape one or more
+LinkedIn profiles concurrently from a single logged-in browser context.
 """
 import asyncio
+import sys
+from pathlib import Path
 from linkedin_scraper.scrapers.person import PersonScraper
 from linkedin_scraper.core.browser import BrowserManager
 
+# Session file (must be created first - see README for setup)
+SESSION_FILE = "linkedin_session.json"
+
+
+async def scrape_many(urls, max_parallel=5):
+    """Scrape several profiles at once, each on its own page"""
+    # Initialize and start browser using context manager, with the saved
+    # session applied as the context is created; images, fonts, media and
+    # trackers are skipped since only text is read
+    async with BrowserManager(
+        headless=False, block_assets=True, storage_state=SESSION_FILE
+    ) as browser:
+        print("✓ Session loaded")
+        
+        # Scrape the profiles on up to max_parallel pages of the same context
+        print(f"🚀 Scraping {len(urls)} profile(s)")
+        results = await PersonScraper.scrape_many(
+            browser.context,
+            urls,
+            concurrency=max_parallel,
+            about_limit=100,  # Only the first 100 characters are shown below
+        )
+        
+        # Keep the refreshed cookies for the next run
+        await browser.save_session(SESSION_FILE)
+    
+    # Display results, formatted up front and written in one go
+    sys.stdout.write("".join(format_result(url, person) for url, person in zip(urls, results)))
+    
+    return results
+
+
+def format_result(url, person):
+    """Format one scrape result as a report block"""
+    separator = "="*60
+    if isinstance(person, BaseException):
+        return f"\n{separator}\n✗ {url}: {person}\n"
+    about = f"{person.about[:100]}..." if person.about else "N/A"
+    return (
+        f"\n{separator}\n"
+        f"Name: {person.name}\n"
+        f"Location: {person.location}\n"
+        f"About: {about}\n"
+        f"Experiences: {len(person.experiences)}\n"
+        f"Education: {len(person.educations)}\n"
+        f"{separator}\n"
+    )
+
 
 async def main():
     """Scrape a single person profile"""
     profile_url = "https://www.linkedin.com/in/williamhgates/"
     
-    # Initialize and start browser using context manager
-    async with BrowserManager(headless=False) as browser:
-        # Load existing session (must be created first - see README for setup)
-        await browser.load_session("linkedin_session.json")
-        print("✓ Session loaded")
-        
-        # Initialize scraper with the browser page
-        scraper = PersonScraper(browser.page)
-        
-        # Scrape the profile
-        print(f"🚀 Scraping: {profile_url}")
-        person = await scraper.scrape(profile_url)
-        
-        # Display results
-        print("\n" + "="*60)
-        print(f"Name: {person.name}")
-        print(f"Location: {person.location}")
-        print(f"About: {person.about[:100]}..." if person.about else "About: N/A")
-        print(f"Experiences: {len(person.experiences)}")
-        print(f"Education: {len(person.educations)}")
-        print("="*60)
+    # Without this check a missing file only surfaces as "Failed to start browser"
+    if not Path(SESSION_FILE).exists():
+        print(f"✗ Session file {SESSION_FILE} not found")
+        print("  Create one first: python3 samples/create_session.py")
+        return
+    
+    await scrape_many([profile_url])
     
     print("\n✓ Done!")
 
@@ -58,6 +58,9 @@ setup(
         'Operating System :: OS Independent',
     ],
     install_requires=basic_requirements,
+    extras_require={
+        'speedups': ['orjson>=3.9.0'],
+    },
     include_package_data=True,
     project_urls={
         'Bug Reports': 'https://github.com/joeyism/linkedin_scraper/issues',
@@ -2,7 +2,9 @@
 Pytest configuration and fixtures for linkedin_scraper tests.
 """
 import pytest
-import asyncio
+import pytest_asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from linkedin_scraper import BrowserManager
 from linkedin_scraper.callbacks import SilentCallback
@@ -11,13 +13,70 @@ from linkedin_scraper.callbacks import SilentCallback
 # Session file path
 SESSION_FILE = Path(__file__).parent.parent / "linkedin_session.json"
 
+# Page served by the local_site fixture
+LOCAL_PAGE = b"<html><head><title>LocalTest</title></head><body>ok</body></html>"
+
+# Chromium switches for the headless browser tests: skip GPU, extension and
+# background service startup none of them use
+TEST_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+]
+
+
+@pytest.fixture(scope="session")
+def browser_kwargs():
+    """
+    Fixture that provides the BrowserManager options of the headless tests.
+    
+    Tests that launch their own browser pass these plus per-test options:
+    BrowserManager(**browser_kwargs, pool=pool).
+    """
+    return {"headless": True, "block_assets": True, "args": TEST_ARGS}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_browser(browser_kwargs):
+    """
+    Fixture that provides one headless BrowserManager for the whole session.
+    
+    Tests that only need a page should open their own with new_page() and
+    close it, instead of launching a browser each. Tests using it must run
+    on the session loop: @pytest.mark.asyncio(loop_scope="session").
+    """
+    async with BrowserManager(**browser_kwargs) as browser_manager:
+        yield browser_manager
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def local_site():
+    """
+    Fixture that serves LOCAL_PAGE on a random loopback port.
+    
+    Lets browser tests navigate without depending on the internet.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(LOCAL_PAGE)))
+            self.end_headers()
+            self.wfile.write(LOCAL_PAGE)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
 
 
 @pytest.fixture
@@ -29,7 +88,7 @@ async def browser():
     Note: Uses headless=False for LinkedIn compatibility.
     LinkedIn may block or behave differently in headless mode.
     """
-    async with BrowserManager(headless=False) as browser_manager:
+    async with BrowserManager(headless=False, block_assets=True) as browser_manager:
         # Try to load session if it exists
         if SESSION_FILE.exists():
             await browser_manager.load_session(str(SESSION_FILE))
@@ -48,7 +107,7 @@ async def browser_with_session():
     if not SESSION_FILE.exists():
         pytest.skip("Session file not found. See README for session setup instructions.")
     
-    async with BrowserManager(headless=False) as browser_manager:
+    async with BrowserManager(headless=False, block_assets=True) as browser_manager:
         await browser_manager.load_session(str(SESSION_FILE))
         yield browser_manager
 
@@ -1,14 +1,14 @@
 """Tests for authentication functions."""
 import pytest
 from linkedin_scraper import BrowserManager
-from linkedin_scraper.core.auth import is_logged_in
+from linkedin_scraper.core.auth import is_logged_in, is_auth_blocked
 
 
 @pytest.mark.asyncio
 async def test_is_logged_in_false():
     """Test is_logged_in returns False when not logged in."""
-    async with BrowserManager(headless=True) as browser:
-        await browser.page.goto("https://www.linkedin.com")
+    async with BrowserManager(headless=True, block_assets=True) as browser:
+        await browser.page.goto("https://www.linkedin.com", wait_until="domcontentloaded")
         logged_in = await is_logged_in(browser.page)
         # Should not be logged in to a fresh page
         assert isinstance(logged_in, bool)
@@ -19,7 +19,15 @@ async def test_is_logged_in_false():
 async def test_is_logged_in_with_session(browser_with_session):
     """Test is_logged_in returns True with valid session."""
     # Navigate to LinkedIn first
-    await browser_with_session.page.goto("https://www.linkedin.com/feed/")
+    await browser_with_session.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
     await browser_with_session.page.wait_for_load_state("domcontentloaded", timeout=15000)
     logged_in = await is_logged_in(browser_with_session.page)
     assert logged_in is True
+
+
+@pytest.mark.unit
+def test_is_auth_blocked():
+    """Test login and challenge URLs are recognised as unauthenticated."""
+    assert is_auth_blocked("https://www.linkedin.com/authwall?trk=foo")
+    assert is_auth_blocked("https://www.linkedin.com/checkpoint/challenge/abc")
+    assert not is_auth_blocked("https://www.linkedin.com/in/williamhgates/")
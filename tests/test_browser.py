@@ -1,54 +1,422 @@
 """Tests for BrowserManager."""
+import importlib.util
+import os
+import stat
+import sys
 import pytest
 from pathlib import Path
-from linkedin_scraper import BrowserManager
+from linkedin_scraper import BrowserManager, BrowserPool, BrowserContextPool
+from linkedin_scraper.core import browser as browser_module
+from linkedin_scraper.core.browser import _dedupe_cookies, _write_private_file
 
 
-@pytest.mark.asyncio
-async def test_browser_manager_context():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_manager_context(shared_browser):
     """Test BrowserManager as context manager."""
-    async with BrowserManager(headless=True) as browser:
-        assert browser.page is not None
-        assert browser.context is not None
-        assert browser.browser is not None
+    assert shared_browser.page is not None
+    assert shared_browser.context is not None
+    assert shared_browser.browser is not None
 
 
-@pytest.mark.asyncio
-async def test_browser_manager_navigation():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_manager_navigation(shared_browser, local_site):
     """Test basic navigation."""
-    async with BrowserManager(headless=True) as browser:
-        await browser.page.goto("https://www.google.com")
-        title = await browser.page.title()
-        assert "Google" in title
+    page = await shared_browser.new_page()
+    try:
+        await page.goto(local_site, wait_until="domcontentloaded")
+        title = await page.title()
+        assert "LocalTest" in title
+    finally:
+        await page.close()
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_browser_manager_session_save_load(tmp_path):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_manager_session_save_load(shared_browser, tmp_path, local_site):
     """Test session save and load."""
     session_file = tmp_path / "test_session.json"
+    context = shared_browser.context
     
-    async with BrowserManager(headless=True) as browser:
-        # Navigate to a page
-        await browser.page.goto("https://www.google.com")
-        
+    # Set a cookie that has to survive the round-trip
+    await context.add_cookies(
+        [{"name": "persist_test", "value": "1", "url": local_site}]
+    )
+    try:
         # Save session
-        await browser.save_session(str(session_file))
+        await shared_browser.save_session(str(session_file))
         assert session_file.exists()
+    finally:
+        await context.clear_cookies(name="persist_test")
     
-    # Load session in new browser
-    async with BrowserManager(headless=True) as browser:
-        await browser.load_session(str(session_file))
-        # Should have cookies loaded
-        cookies = await browser.context.cookies()
-        assert len(cookies) >= 0  # At least session was loadable
+    # Restore it into a fresh context on the browser that is already running
+    restored = await shared_browser.browser.new_context(storage_state=str(session_file))
+    try:
+        cookies = await restored.cookies(local_site)
+        assert ("persist_test", "1") in [(c["name"], c["value"]) for c in cookies]
+    finally:
+        await restored.close()
 
 
-@pytest.mark.asyncio
-async def test_browser_manager_headless_mode():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_manager_headless_mode(shared_browser, local_site):
     """Test headless mode."""
-    async with BrowserManager(headless=True) as browser:
-        assert browser.page is not None
-        await browser.page.goto("https://www.example.com")
-        content = await browser.page.content()
-        assert len(content) > 0
+    assert shared_browser.headless
+    page = await shared_browser.new_page()
+    try:
+        await page.goto(local_site, wait_until="domcontentloaded")
+        assert await page.evaluate("document.documentElement.outerHTML.length > 0")
+    finally:
+        await page.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_pool_reuses_browser(browser_kwargs):
+    """Test that a pooled browser is reused by the next manager."""
+    pool = BrowserPool()
+    try:
+        async with BrowserManager(**browser_kwargs, pool=pool) as browser:
+            first = browser.browser
+        
+        async with BrowserManager(**browser_kwargs, pool=pool, page_pool_size=1) as browser:
+            assert browser.browser is first
+            page = await browser.new_page()
+            assert page is not None
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_browser_context_pool_checkout(browser_kwargs):
+    """Test contexts are handed out once at a time and returned after use."""
+    async with BrowserManager(**browser_kwargs) as browser:
+        async with BrowserContextPool(browser.browser, size=2) as pool:
+            async with pool.acquire() as first, pool.acquire() as second:
+                assert first is not second
+            
+            async with pool.acquire() as context:
+                assert context in (first, second)
+
+
+@pytest.mark.unit
+def test_dedupe_cookies():
+    """Test duplicate and malformed cookies are dropped before add_cookies."""
+    cookies = [
+        {"name": "li_at", "value": "old", "domain": ".linkedin.com", "path": "/"},
+        {"name": "li_at", "value": "new", "domain": ".linkedin.com", "path": "/"},
+        {"name": "lang", "value": "en", "url": "https://www.linkedin.com"},
+        {"value": "no-name", "domain": ".linkedin.com"},
+        {"name": "no-domain", "value": "x"},
+    ]
+    
+    result = _dedupe_cookies(cookies)
+    
+    assert [c["name"] for c in result] == ["li_at", "lang"]
+    assert result[0]["value"] == "new"
+
+
+@pytest.mark.unit
+async def test_block_resources_routes_once():
+    """Test the blocking route is installed once per context."""
+    from linkedin_scraper.core import block_resources
+    
+    class FakeContext:
+        def __init__(self):
+            self.routes = 0
+        
+        async def route(self, pattern, handler):
+            self.routes += 1
+    
+    context = FakeContext()
+    await block_resources(context)
+    await block_resources(context)
+    assert context.routes == 1
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.closed = False
+    
+    async def goto(self, url, **kwargs):
+        self.url = url
+    
+    async def close(self):
+        self.closed = True
+        if self in self.context.pages:
+            self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+        self.cookie_calls = []
+    
+    async def add_cookies(self, cookies):
+        self.cookie_calls.append(list(cookies))
+    
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+    
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+    
+    def is_connected(self):
+        return self.connected
+    
+    async def new_context(self, **kwargs):
+        return FakeContext()
+    
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    """Stand-in for async_playwright() that counts browser launches."""
+    
+    def __init__(self):
+        self.launched = []
+        self.stopped = 0
+        self.chromium = self
+    
+    def __call__(self):
+        return self
+    
+    async def start(self):
+        return self
+    
+    async def launch(self, **kwargs):
+        self.launched.append(FakeBrowser())
+        return self.launched[-1]
+    
+    async def stop(self):
+        self.stopped += 1
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    """Patch Playwright so BrowserManager runs without launching Chromium."""
+    import playwright.async_api
+    
+    fake = FakePlaywright()
+    monkeypatch.setattr(playwright.async_api, "async_playwright", fake)
+    return fake
+
+
+@pytest.mark.unit
+async def test_browser_manager_nested_start_close(fake_playwright):
+    """Test start()/close() are reference counted."""
+    browser = BrowserManager()
+    await browser.start()
+    await browser.start()
+    assert len(fake_playwright.launched) == 1
+    
+    await browser.close()
+    assert browser.context is not None
+    assert fake_playwright.launched[0].is_connected()
+    
+    await browser.close()
+    assert not fake_playwright.launched[0].is_connected()
+    assert fake_playwright.stopped == 1
+    with pytest.raises(RuntimeError):
+        browser.context
+
+
+@pytest.mark.unit
+async def test_browser_manager_reuse_pauses_and_resumes(fake_playwright):
+    """Test a reusable manager pauses on exit and reuses its browser."""
+    browser = BrowserManager(reuse=True)
+    async with browser:
+        context = browser.context
+        extra = await browser.new_page()
+        await browser.page.goto("https://www.linkedin.com/feed/")
+    
+    # Paused: browser and context alive, extra pages closed, main page blank
+    assert browser.context is context
+    assert extra.closed
+    assert browser.page.url == "about:blank"
+    
+    await browser.resume()
+    async with browser:
+        assert browser.context is context
+    assert len(fake_playwright.launched) == 1
+    
+    await browser.close()
+    assert not fake_playwright.launched[0].is_connected()
+
+
+@pytest.mark.unit
+async def test_browser_manager_resume_after_disconnect(fake_playwright):
+    """Test resume() launches a new browser when the old one is gone."""
+    browser = BrowserManager(reuse=True)
+    async with browser:
+        pass
+    
+    fake_playwright.launched[0].connected = False
+    await browser.resume()
+    
+    assert len(fake_playwright.launched) == 2
+    assert fake_playwright.stopped == 1
+    assert browser.browser is fake_playwright.launched[1]
+    await browser.close()
+
+
+@pytest.mark.unit
+async def test_browser_manager_failed_relaunch_tears_down(fake_playwright, monkeypatch):
+    """Test a relaunch that fails after a nested start closes what it launched."""
+    from linkedin_scraper.core.exceptions import NetworkError
+    
+    browser = BrowserManager()
+    await browser.start()
+    await browser.start()
+    fake_playwright.launched[0].connected = False
+    
+    new_context = FakeBrowser.new_context
+    
+    async def fail_new_context(self, **kwargs):
+        raise RuntimeError("context failed")
+    
+    monkeypatch.setattr(FakeBrowser, "new_context", fail_new_context)
+    with pytest.raises(NetworkError):
+        await browser.start()
+    
+    # The relaunched browser and its driver are gone; only this call's count is undone
+    assert len(fake_playwright.launched) == 2
+    assert not fake_playwright.launched[1].is_connected()
+    assert fake_playwright.stopped == 2
+    assert browser._start_count == 2
+    assert browser._browser is None and browser._playwright is None
+    
+    # The next start() relaunches cleanly
+    monkeypatch.setattr(FakeBrowser, "new_context", new_context)
+    await browser.start()
+    assert browser.browser is fake_playwright.launched[2]
+    for _ in range(3):
+        await browser.close()
+    assert not fake_playwright.launched[2].is_connected()
+
+
+@pytest.mark.unit
+async def test_browser_context_pool_ignores_double_release():
+    """Test a context released twice is not handed out twice."""
+    async with BrowserContextPool(FakeBrowser(), size=2) as pool:
+        async with pool.acquire() as context:
+            pool._release(context)
+        assert pool._idle.qsize() == 2
+        
+        async with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes only")
+def test_write_private_file_mode(tmp_path):
+    """Test session files are written owner-only, even over an existing file."""
+    path = tmp_path / "session.json"
+    path.write_bytes(b"old contents that are longer")
+    path.chmod(0o644)
+    
+    _write_private_file(path, b'{"cookies": []}')
+    
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert path.read_bytes() == b'{"cookies": []}'
+
+
+STORAGE_STATE = {
+    "cookies": [{"name": "li_at", "value": "t\u00f6ken", "domain": ".linkedin.com", "path": "/"}],
+    "origins": [],
+}
+
+
+@pytest.mark.unit
+def test_session_serialization_round_trip(tmp_path):
+    """Test storage state survives _dumps/_loads and a private file write."""
+    path = tmp_path / "session.json"
+    _write_private_file(path, browser_module._dumps(STORAGE_STATE))
+    assert browser_module._loads(path.read_bytes()) == STORAGE_STATE
+
+
+@pytest.mark.unit
+def test_session_serialization_without_orjson(monkeypatch):
+    """Test the json fallback produces the same round-trip as orjson."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location(
+        "linkedin_scraper.core._browser_without_orjson", browser_module.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    assert module._dumps.__module__ == module.__name__
+    assert module._loads.__module__ == "json"
+    data = module._dumps(STORAGE_STATE)
+    assert isinstance(data, bytes)
+    assert module._loads(data) == STORAGE_STATE
+    assert browser_module._loads(data) == STORAGE_STATE
+
+
+@pytest.mark.unit
+async def test_cookie_batch_flushes_on_exit(fake_playwright):
+    """Test cookie_batch() holds set_cookie() calls and sends one deduped batch."""
+    async with BrowserManager() as browser:
+        context = browser.context
+        async with browser.cookie_batch():
+            await browser.set_cookie("li_at", "old")
+            async with browser.cookie_batch():
+                await browser.set_cookie("JSESSIONID", "ajax:1")
+            await browser.set_cookie("li_at", "new")
+            assert context.cookie_calls == []
+        
+        assert len(context.cookie_calls) == 1
+        assert sorted((c["name"], c["value"]) for c in context.cookie_calls[0]) == [
+            ("JSESSIONID", "ajax:1"),
+            ("li_at", "new"),
+        ]
+        
+        # Outside a batch set_cookie() goes straight to the context
+        await browser.set_cookie("lang", "v=2&lang=en-us")
+        assert len(context.cookie_calls) == 2
+
+
+@pytest.mark.unit
+async def test_cookie_batch_discards_pending_on_error(fake_playwright):
+    """Test cookies collected in a failed batch are not sent."""
+    async with BrowserManager() as browser:
+        with pytest.raises(ValueError):
+            async with browser.cookie_batch():
+                await browser.set_cookie("li_at", "token")
+                raise ValueError("boom")
+        
+        assert browser.context.cookie_calls == []
+        assert browser._pending_cookies is None
+
+
+@pytest.mark.unit
+async def test_set_cookies_bulk_batches(fake_playwright):
+    """Test set_cookies_bulk() splits large sets into driver-sized batches."""
+    size = browser_module._COOKIE_BATCH_SIZE
+    async with BrowserManager() as browser:
+        await browser.set_cookies_bulk(
+            [(f"c{i}", str(i)) for i in range(size + 1)], domain=".example.com"
+        )
+        calls = browser.context.cookie_calls
+    
+    assert [len(call) for call in calls] == [size, 1]
+    assert all(c["domain"] == ".example.com" and c["path"] == "/" for c in calls[0])
+
+
+@pytest.mark.unit
+async def test_cookie_apis_require_context():
+    """Test the cookie APIs fail clearly before start()."""
+    browser = BrowserManager()
+    with pytest.raises(RuntimeError):
+        await browser.set_cookie("li_at", "token")
+    with pytest.raises(RuntimeError):
+        await browser.set_cookies([])
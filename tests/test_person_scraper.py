@@ -125,3 +125,165 @@ def test_person_model_to_json():
     json_str = person.to_json()
     assert isinstance(json_str, str)
     assert "Test User" in json_str
+
+
+@pytest.mark.unit
+def test_parse_work_times():
+    """Test splitting experience date ranges and durations."""
+    scraper = PersonScraper(page=None)
+    
+    assert scraper._parse_work_times("2000 - Present · 26 yrs 1 mo") == ("2000", "Present", "26 yrs 1 mo")
+    assert scraper._parse_work_times("Jan 2020 - Dec 2022 · 2 yrs") == ("Jan 2020", "Dec 2022", "2 yrs")
+    assert scraper._parse_work_times("2015 - Present") == ("2015", "Present", None)
+    assert scraper._parse_work_times("Jan 2020 - Dec 2022 · 1 yr · Remote") == ("Jan 2020", "Dec 2022", "1 yr")
+    assert scraper._parse_work_times("2015") == ("2015", "", None)
+    assert scraper._parse_work_times("5 yrs 2 mos") == (None, None, "5 yrs 2 mos")
+    assert scraper._parse_work_times("1 yr") == (None, None, "1 yr")
+    assert scraper._parse_work_times("") == (None, None, None)
+
+
+@pytest.mark.unit
+def test_parse_education_times():
+    """Test splitting education date ranges."""
+    scraper = PersonScraper(page=None)
+    
+    assert scraper._parse_education_times("1973 - 1977") == ("1973", "1977")
+    assert scraper._parse_education_times("2010 – 2014") == ("2010", "2014")
+    assert scraper._parse_education_times("2015") == ("2015", "2015")
+    assert scraper._parse_education_times("") == (None, None)
+    # Open range and extra separators keep the baseline split(" - ") results
+    assert scraper._parse_education_times("2015 - ") == ("2015", "")
+    assert scraper._parse_education_times("2010 - 2012 - 2014") == ("2010", "2012")
+    assert scraper._parse_education_times(" 2015 ") == ("2015", "2015")
+
+
+@pytest.mark.unit
+def test_map_interest_tab_to_category():
+    """Test mapping interest tab names to categories."""
+    scraper = PersonScraper(page=None)
+    
+    assert scraper._map_interest_tab_to_category("Companies") == "company"
+    assert scraper._map_interest_tab_to_category("Groups") == "group"
+    assert scraper._map_interest_tab_to_category("Schools") == "school"
+    assert scraper._map_interest_tab_to_category("Newsletters") == "newsletter"
+    assert scraper._map_interest_tab_to_category("Top Voices") == "influencer"
+    assert scraper._map_interest_tab_to_category("Influencers") == "influencer"
+    assert scraper._map_interest_tab_to_category("Podcasts") == "podcasts"
+
+
+@pytest.mark.unit
+def test_profile_base_url():
+    """Test subpage URLs stay under the profile path."""
+    from linkedin_scraper.scrapers.person import _profile_base_url
+    
+    expected = "https://www.linkedin.com/in/williamhgates/"
+    assert _profile_base_url("https://www.linkedin.com/in/williamhgates") == expected
+    assert _profile_base_url("https://www.linkedin.com/in/williamhgates/") == expected
+    assert _profile_base_url("https://www.linkedin.com/in/williamhgates/?trk=foo#about") == expected
+    
+    # Plain concatenation matches urljoin on the normalized base
+    from urllib.parse import urljoin
+    
+    for path in ("details/experience/", "details/certifications/", "overlay/contact-info/"):
+        assert f"{expected}{path}" == urljoin(expected, path)
+
+
+@pytest.mark.unit
+def test_name_from_title():
+    """Test recovering the profile name from the page title."""
+    from linkedin_scraper.scrapers.person import _name_from_title
+    
+    assert _name_from_title("Bill Gates | LinkedIn") == "Bill Gates"
+    assert _name_from_title("(3) Bill Gates | LinkedIn") == "Bill Gates"
+    assert _name_from_title("(99+) Bill Gates | LinkedIn") == "Bill Gates"
+    assert _name_from_title("LinkedIn") == ""
+    assert _name_from_title("") == ""
+
+
+@pytest.mark.unit
+def test_parse_accomplishment_item():
+    """Test parsing an accomplishment item snapshot."""
+    scraper = PersonScraper(page=None)
+    
+    item = {
+        "spans": ["Azure Fundamentals", "Issued by Microsoft · Jan 2021", "Credential ID AZ-900"],
+        "credentialUrl": "https://learn.microsoft.com/verify/123",
+    }
+    accomplishment = scraper._parse_accomplishment_item(item, "certification")
+    assert accomplishment.title == "Azure Fundamentals"
+    assert accomplishment.issuer == "Microsoft"
+    assert accomplishment.issued_date == "Jan 2021"
+    assert accomplishment.credential_id == "AZ-900"
+    assert accomplishment.credential_url == "https://learn.microsoft.com/verify/123"
+    
+    item = {"spans": ["Dean's List", "Stanford University", "Mar 2019 · 1 mo"], "credentialUrl": None}
+    accomplishment = scraper._parse_accomplishment_item(item, "honor")
+    assert accomplishment.issuer == "Stanford University"
+    assert accomplishment.issued_date == "Mar 2019"
+    
+    # Only the segment after "Issued by <issuer> ·" is the date
+    item = {"spans": ["AWS Solutions Architect", "Issued by Amazon · Jan 2021 · Expires Jan 2024"], "credentialUrl": None}
+    accomplishment = scraper._parse_accomplishment_item(item, "certification")
+    assert accomplishment.issuer == "Amazon"
+    assert accomplishment.issued_date == "Jan 2021"
+    
+    # Full month names are dates too
+    for date in ("March 2021", "September 2020"):
+        item = {"spans": ["Dean's List", "Stanford University", f"{date} · 1 mo"], "credentialUrl": None}
+        assert scraper._parse_accomplishment_item(item, "honor").issued_date == date
+    
+    assert scraper._parse_accomplishment_item({"spans": [], "credentialUrl": None}, "honor") is None
+
+
+@pytest.mark.unit
+def test_contacts_from_api():
+    """Test mapping a Voyager contact info response to contacts."""
+    from linkedin_scraper.scrapers.person import _contacts_from_api
+    
+    data = {
+        "emailAddress": "bill@example.com",
+        "websites": [
+            {
+                "url": "https://www.gatesnotes.com",
+                "type": {"com.linkedin.voyager.identity.profile.StandardWebsite": {"category": "PERSONAL"}},
+            },
+        ],
+        "phoneNumbers": [{"number": "+1 555 0100", "type": "WORK"}],
+        "twitterHandles": [{"name": "BillGates"}],
+        "birthDateOn": {"month": 10, "day": 28},
+    }
+    contacts = _contacts_from_api(data, "https://www.linkedin.com/in/williamhgates/")
+    
+    assert [(c.type, c.value, c.label) for c in contacts] == [
+        ("linkedin", "https://www.linkedin.com/in/williamhgates/", None),
+        ("website", "https://www.gatesnotes.com", "Personal"),
+        ("email", "bill@example.com", None),
+        ("phone", "+1 555 0100", "Work"),
+        ("twitter", "BillGates", None),
+        ("birthday", "October 28", None),
+    ]
+
+
+@pytest.mark.unit
+def test_selector_overrides():
+    """Test selector overrides are merged once over the shared defaults."""
+    from linkedin_scraper.scrapers import SELECTORS
+    
+    assert PersonScraper(page=None).selectors is SELECTORS
+    
+    scraper = PersonScraper(page=None, selectors={"location": ".top-card__location"})
+    assert scraper.selectors["location"] == ".top-card__location"
+    assert scraper.selectors["dialog"] == SELECTORS["dialog"]
+    
+    # A complete mapping, e.g. one handed to sibling-page scrapers, is reused
+    assert PersonScraper(page=None, selectors=scraper.selectors).selectors is scraper.selectors
+    
+    with pytest.raises(TypeError):
+        scraper.selectors["location"] = "h2"
+    
+    # Keys queried inside page scripts reject Playwright-only syntax
+    with pytest.raises(ValueError):
+        PersonScraper(page=None, selectors={"name": 'text="Bill Gates"'})
+    with pytest.raises(ValueError):
+        PersonScraper(page=None, selectors={"location": "span:has-text('Seattle')"})
+    PersonScraper(page=None, selectors={"nothing_to_see": 'text="Nothing here"'})
@@ -0,0 +1,38 @@
+"""Tests for scraping utilities."""
+import pytest
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from linkedin_scraper.core.utils import wait_for_all
+
+
+class NavigatingPage:
+    """Page whose in-page evaluate is interrupted by a client-side redirect."""
+    
+    def __init__(self, present):
+        self.present = present
+    
+    async def evaluate(self, expression, arg=None):
+        raise PlaywrightError("Execution context was destroyed, most likely because of a navigation")
+    
+    async def wait_for_selector(self, selector, timeout=None, state=None):
+        if selector not in self.present:
+            raise PlaywrightTimeoutError(f"Timeout waiting for {selector}")
+
+
+@pytest.mark.unit
+async def test_wait_for_all_survives_navigation():
+    """Test wait_for_all falls back to wait_for_selector after a redirect."""
+    page = NavigatingPage(present={"main"})
+    
+    assert await wait_for_all(page, ["main"]) == []
+    assert await wait_for_all(page, ["main", "main h1"]) == ["main h1"]
+
+
+@pytest.mark.unit
+async def test_wait_for_all_reraises_other_errors():
+    """Test evaluate errors unrelated to navigation still propagate."""
+    class BrokenPage(NavigatingPage):
+        async def evaluate(self, expression, arg=None):
+            raise PlaywrightError("Target page, context or browser has been closed")
+    
+    with pytest.raises(PlaywrightError):
+        await wait_for_all(BrokenPage(present=set()), ["main"])